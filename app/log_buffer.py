@@ -1,51 +1,85 @@
 """In-memory log buffer for exposing backend logs to the UI."""
 import logging
 import threading
+from collections import deque
+from itertools import islice
 
 LOG_BUFFER_MAX_LINES = 1000
 _FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 
 
+class LogBuffer:
+    """
+    Fixed-size ring of log lines plus the total count ever appended. Both change together under one lock,
+    so count - len(lines) is always the cursor of the first retained line (cursors for ?since=).
+    """
+
+    def __init__(self, max_lines: int = LOG_BUFFER_MAX_LINES):
+        self._lines: deque[str] = deque(maxlen=max_lines)
+        self._count = 0
+        self._lock = threading.Lock()
+
+    def append(self, line: str) -> None:
+        """Append one line; the oldest line rolls out once the buffer is full."""
+        with self._lock:
+            self._lines.append(line)
+            self._count += 1
+
+    def lines(self) -> list[str]:
+        """Return a copy of the retained lines."""
+        with self._lock:
+            return list(self._lines)
+
+    def since(self, since: int = 0) -> tuple[list[str], int]:
+        """Return (retained lines appended after cursor since, next cursor)."""
+        with self._lock:
+            first = self._count - len(self._lines)
+            return list(islice(self._lines, max(since - first, 0), None)), self._count
+
+
 class InMemoryLogHandler(logging.Handler):
-    """Thread-safe handler that appends formatted log records to a fixed-size buffer."""
+    """Thread-safe handler that appends formatted log records to a LogBuffer."""
 
-    def __init__(self, buffer: list, lock: threading.Lock, max_lines: int = LOG_BUFFER_MAX_LINES):
+    def __init__(self, buffer: LogBuffer):
         super().__init__()
         self._buffer = buffer
-        self._lock = lock
-        self._max_lines = max_lines
         self.setFormatter(logging.Formatter(_FORMAT))
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            msg = self.format(record)
-            with self._lock:
-                self._buffer.append(msg)
-                while len(self._buffer) > self._max_lines:
-                    self._buffer.pop(0)
+            self._buffer.append(self.format(record))
         except Exception:
             self.handleError(record)
 
 
-# Shared buffer and lock; populated by InMemoryLogHandler when attached to root logger
-_log_lines: list[str] = []
-_log_lock = threading.Lock()
+# Shared buffer; populated by InMemoryLogHandler when attached to root logger
+_log_buffer = LogBuffer()
 
 
-def get_log_buffer() -> tuple[list[str], threading.Lock]:
-    """Return the shared log buffer and its lock (for reading)."""
-    return _log_lines, _log_lock
+def get_log_buffer() -> LogBuffer:
+    """Return the shared log buffer."""
+    return _log_buffer
 
 
 def get_log_lines() -> list[str]:
     """Return a copy of the current log lines (thread-safe)."""
-    with _log_lock:
-        return list(_log_lines)
+    return _log_buffer.lines()
+
+
+def get_log_lines_since(since: int = 0) -> tuple[list[str], int]:
+    """
+    Return (lines appended after cursor since, next cursor). Cursors count lines ever logged, so they
+    stay valid as old lines roll out of the buffer; lines that already rolled out are skipped.
+    """
+    return _log_buffer.since(since)
 
 
 def install_log_buffer_handler(max_lines: int = LOG_BUFFER_MAX_LINES) -> None:
     """Add InMemoryLogHandler to the root logger. Call from main.py on startup."""
+    global _log_buffer
+    if max_lines != _log_buffer._lines.maxlen:
+        _log_buffer = LogBuffer(max_lines)
     root = logging.getLogger()
-    handler = InMemoryLogHandler(_log_lines, _log_lock, max_lines=max_lines)
+    handler = InMemoryLogHandler(_log_buffer)
     handler.setLevel(logging.DEBUG)
     root.addHandler(handler)
@@ -1,9 +1,11 @@
 """FastAPI application entry point."""
+import hashlib
 import logging
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 from app.config import get_settings
 from app.routers import (
     # CS1
@@ -18,6 +20,7 @@ from app.routers import (
     evidence_router,
     report_router,
     logs_router,
+    batch_router,
 )
 
 # Configure logging
@@ -100,6 +103,41 @@ def create_app() -> FastAPI:
     app.include_router(evidence_router)
     app.include_router(report_router)
     app.include_router(logs_router)
+    app.include_router(batch_router)
+
+    # Conditional GET: tag JSON GET responses with an ETag; matching If-None-Match gets a bodyless 304
+    @app.middleware("http")
+    async def etag_middleware(request: Request, call_next):
+        response = await call_next(request)
+        if (
+            request.method != "GET"
+            or response.status_code != 200
+            or not response.headers.get("content-type", "").startswith("application/json")
+        ):
+            return response
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = f'W/"{hashlib.sha1(body).hexdigest()}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        rebuilt = Response(
+            content=body,
+            status_code=response.status_code,
+            media_type=response.headers.get("content-type"),
+        )
+        # Copy raw headers so repeated ones (e.g. Set-Cookie) survive; Response already set
+        # content-length for the rebuilt body and the content-type
+        rebuilt.raw_headers.extend(
+            (k, v)
+            for k, v in response.headers.raw
+            if k.lower() not in (b"content-length", b"content-type")
+        )
+        rebuilt.headers["etag"] = etag
+        return rebuilt
+
+    # Compress large responses for clients that accept gzip (added last, so it wraps the ETag step
+    # and the ETag is computed over the uncompressed body)
+    app.add_middleware(GZipMiddleware, minimum_size=1000)
+
     # Global exception handler
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception):
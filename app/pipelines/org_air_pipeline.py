@@ -81,24 +81,24 @@ class OrgAIRPipeline:
         Raises ValueError if company not found.
         Does NOT persist; persistence is the caller's responsibility.
         """
-        # Company + industry info
+        # Company + its industry in one query (no full industries table per call)
         co = db.execute_one(
-            "SELECT id, name, ticker, industry_id FROM companies WHERE id = %s AND is_deleted = FALSE",
+            """
+            SELECT c.id, c.name, c.ticker, c.industry_id,
+                   i.sector AS industry_sector, i.h_r_base AS industry_h_r_base
+            FROM companies c
+            LEFT JOIN industries i ON i.id = c.industry_id
+            WHERE c.id = %s AND c.is_deleted = FALSE
+            """,
             (company_id,),
         )
         if not co:
             raise ValueError(f"Company {company_id} not found")
 
-        industries = {
-            r["id"]: r
-            for r in db.execute_query(
-                "SELECT id, name, sector, h_r_base FROM industries"
-            )
-        }
-        industry_row = industries.get(co["industry_id"], {})
-        db_sector = industry_row.get("sector", "Services")
+        db_sector = co.get("industry_sector") or "Services"
         pf_sector = _SECTOR_MAP.get(db_sector, "business_services")
-        h_r_base = float(industry_row.get("h_r_base", 65.0))
+        h_r_base = co.get("industry_h_r_base")
+        h_r_base = float(h_r_base) if h_r_base is not None else 65.0
         ticker = co["ticker"]
         mcap_pct = _MARKET_CAP_PCT.get(ticker, 0.5)
 
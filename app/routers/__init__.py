@@ -12,6 +12,7 @@ from .signals import router as signals_router
 from .evidence import router as evidence_router
 from .report import router as report_router
 from .logs import router as logs_router
+from .batch import router as batch_router
 
 __all__ = [
     "health_router",
@@ -24,4 +25,5 @@ __all__ = [
     "evidence_router",
     "report_router",
     "logs_router",
+    "batch_router",
 ]
\ No newline at end of file
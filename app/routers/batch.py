@@ -0,0 +1,66 @@
+"""Batch endpoint: run several API calls in one round trip (used by the Streamlit UI)."""
+import re
+from typing import Any, Literal, Optional
+from urllib.parse import unquote
+
+import httpx
+from fastapi import APIRouter, HTTPException, Request, status
+from pydantic import BaseModel, Field
+
+router = APIRouter(prefix="/api/v1", tags=["batch"])
+
+BATCH_MAX_CALLS = 20
+_API_PREFIX = "/api/v1/"
+_BATCH_PATH = "/api/v1/batch"
+
+
+class BatchCall(BaseModel):
+    method: Literal["GET", "POST", "PUT", "DELETE"] = "GET"
+    path: str
+    params: Optional[dict[str, Any]] = None
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    calls: list[BatchCall] = Field(..., min_length=1, max_length=BATCH_MAX_CALLS)
+
+
+def _is_allowed_path(raw_path: str) -> bool:
+    """
+    True if raw_path targets /api/v1/* other than the batch endpoint itself. Checks the path the
+    app will actually route (percent-decoded, repeated slashes collapsed) and rejects dot segments,
+    so spellings like /api/v1/../v1/batch or /api/v1/%62atch cannot nest a batch.
+    """
+    path = unquote(raw_path.split("?", 1)[0].split("#", 1)[0])
+    if "\\" in path or any(seg in (".", "..") for seg in path.split("/")):
+        return False
+    path = re.sub(r"/{2,}", "/", path)
+    return path.startswith(_API_PREFIX) and path.rstrip("/") != _BATCH_PATH
+
+
+@router.post("/batch")
+async def run_batch(request: BatchRequest, http_request: Request):
+    """
+    Run calls in order against this app (in-process, no extra network hop) and return
+    { results: [{ status, json }, ...] } in the same order. Calls run sequentially, so a
+    later call sees the effects of an earlier one (e.g. score-by-ticker then dimension-scores).
+    """
+    for call in request.calls:
+        if not _is_allowed_path(call.path):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid batch path: {call.path}",
+            )
+
+    results = []
+    # An unhandled error in one call comes back as that call's 500 instead of failing the whole batch
+    transport = httpx.ASGITransport(app=http_request.app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://batch") as client:
+        for call in request.calls:
+            r = await client.request(call.method, call.path, params=call.params, json=call.body)
+            try:
+                payload = r.json()
+            except ValueError:
+                payload = r.text or None
+            results.append({"status": r.status_code, "json": payload})
+    return {"results": results}
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 from typing import Optional
 from uuid import UUID, uuid4
 from fastapi import APIRouter, HTTPException, Query, status
+from fastapi.responses import JSONResponse
 from app.config import get_settings
 from app.models import (
     CompanyCreate, CompanyUpdate, CompanyResponse,
@@ -14,6 +15,32 @@ from app.services import get_snowflake_service, get_redis_cache, CacheKeys
 router = APIRouter(prefix="/api/v1/companies", tags=["Companies"])
 
 _COMPANY_COLS = "id, name, ticker, industry_id, position_factor, domain, careers_url, news_url, leadership_url, glassdoor_company_id, created_at, updated_at"
+# Same columns qualified with the companies alias, for queries that join industries
+_COMPANY_COLS_C = ", ".join(f"c.{col.strip()}" for col in _COMPANY_COLS.split(","))
+# Extra item key added by ?expand=industry
+_INDUSTRY_NAME = "industry_name"
+
+
+def _parse_company_fields(fields: Optional[str], expand_industry: bool = False) -> Optional[set[str]]:
+    """
+    Parse a comma-separated ?fields= projection; 400 on names that are not CompanyResponse fields,
+    or on industry_name without expand=industry (the key would never exist).
+    """
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = sorted(requested - set(CompanyResponse.model_fields) - {_INDUSTRY_NAME})
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Unknown fields: {', '.join(unknown)}"
+        )
+    if _INDUSTRY_NAME in requested and not expand_industry:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Field {_INDUSTRY_NAME} requires expand=industry"
+        )
+    return requested or None
 
 
 def _row_to_company_response(row: dict) -> CompanyResponse:
@@ -106,41 +133,69 @@ async def create_company(company: CompanyCreate):
 async def list_companies(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    industry_id: Optional[UUID] = Query(None, description="Filter by industry")
+    industry_id: Optional[UUID] = Query(None, description="Filter by industry"),
+    fields: Optional[str] = Query(None, description="Comma-separated item fields to return (e.g. id,ticker,name)"),
+    expand: Optional[str] = Query(None, pattern="^industry$", description="industry: add industry_name to each item")
 ):
-    """List companies with pagination and optional filtering."""
+    """
+    List companies with pagination and optional filtering. With fields, items carry only those keys;
+    with expand=industry, items also carry industry_name (joined server-side).
+    """
+    expand_industry = expand == "industry"
+    selected = _parse_company_fields(fields, expand_industry)
     db = get_snowflake_service()
     
     # Build query
-    base_query = "FROM companies WHERE is_deleted = FALSE"
+    where = "WHERE c.is_deleted = FALSE"
     params = []
     
     if industry_id:
-        base_query += " AND industry_id = %s"
+        where += " AND c.industry_id = %s"
         params.append(str(industry_id))
     
     # Get total count
-    count_result = db.execute_one(f"SELECT COUNT(*) as count {base_query}", tuple(params))
+    count_result = db.execute_one(f"SELECT COUNT(*) as count FROM companies c {where}", tuple(params))
     total = count_result["count"] if count_result else 0
     
     # Get paginated results
+    cols, join = _COMPANY_COLS_C, ""
+    if expand_industry:
+        cols += f", i.name AS {_INDUSTRY_NAME}"
+        join = "LEFT JOIN industries i ON i.id = c.industry_id"
     offset = (page - 1) * page_size
     query = f"""
-        SELECT {_COMPANY_COLS}
-        {base_query}
-        ORDER BY created_at DESC
+        SELECT {cols}
+        FROM companies c {join}
+        {where}
+        ORDER BY c.created_at DESC
         LIMIT %s OFFSET %s
     """
     params.extend([page_size, offset])
     rows = db.execute_query(query, tuple(params))
     items = [_row_to_company_response(row) for row in rows]
+    total_pages = math.ceil(total / page_size) if total > 0 else 0
+
+    if selected or expand_industry:
+        payload = []
+        for row, item in zip(rows, items):
+            data = item.model_dump(mode="json", include=selected)
+            if expand_industry and (selected is None or _INDUSTRY_NAME in selected):
+                data[_INDUSTRY_NAME] = row.get(_INDUSTRY_NAME)
+            payload.append(data)
+        return JSONResponse({
+            "items": payload,
+            "total": total,
+            "page": page,
+            "page_size": page_size,
+            "total_pages": total_pages,
+        })
     
     return PaginatedResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=math.ceil(total / page_size) if total > 0 else 0
+        total_pages=total_pages
     )
 
 
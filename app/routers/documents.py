@@ -111,12 +111,21 @@ async def collect_documents_all(
 
 
 @router.get("/collect/logs/{task_id}")
-async def get_collect_logs(task_id: str):
+async def get_collect_logs(
+    task_id: str,
+    since: int = Query(0, ge=0, description="Return only lines after this cursor (next_cursor of the previous call)"),
+):
     """Get log lines for a document collection task (for UI scrollable log view)."""
     if task_id not in _TASK_LOGS:
-        return {"task_id": task_id, "logs": [], "finished": False}
+        return {"task_id": task_id, "logs": [], "next_cursor": 0, "finished": False}
     entry = _TASK_LOGS[task_id]
-    return {"task_id": task_id, "logs": entry["lines"], "finished": entry["finished"]}
+    lines = entry["lines"]
+    return {
+        "task_id": task_id,
+        "logs": lines[since:],
+        "next_cursor": len(lines),
+        "finished": entry["finished"],
+    }
 
 
 @router.get("", response_model=PaginatedDocuments)
@@ -1,13 +1,15 @@
 """API endpoint for backend log buffer (UI)."""
-from fastapi import APIRouter
+from fastapi import APIRouter, Query
 
-from app.log_buffer import get_log_lines
+from app.log_buffer import get_log_lines_since
 
 router = APIRouter(prefix="/api/v1", tags=["logs"])
 
 
 @router.get("/logs")
-async def get_logs():
+async def get_logs(
+    since: int = Query(0, ge=0, description="Return only lines after this cursor (next_cursor of the previous call)"),
+):
     """Return recent backend log lines for the UI (scrollable view)."""
-    lines = get_log_lines()
-    return {"lines": lines, "total": len(lines)}
+    lines, next_cursor = get_log_lines_since(since)
+    return {"lines": lines, "total": len(lines), "next_cursor": next_cursor}
@@ -56,6 +56,18 @@ class ComputeScoresResponse(BaseModel):
     org_air: OrgAIRResponse
 
 
+class PrefillResponse(BaseModel):
+    """Company + its industry + current Org-AI-R in one payload (calculator form prefill)."""
+
+    company_id: UUID
+    ticker: str
+    company_name: str
+    industry_id: Optional[UUID] = None
+    industry_name: Optional[str] = None
+    industry_sector: Optional[str] = None
+    org_air: Optional[OrgAIRResponse] = None
+
+
 def _to_response(scores: OrgAIRScores) -> OrgAIRResponse:
     return OrgAIRResponse(
         company_id=UUID(scores.company_id),
@@ -518,6 +530,51 @@ async def get_org_air(company_id: UUID):
     return _to_response(scores)
 
 
+@router.get(
+    "/companies/{company_id}/prefill",
+    response_model=PrefillResponse,
+    summary="Get Calculator Prefill Bundle",
+    tags=["Org-AI-R Scoring"],
+)
+async def get_prefill(company_id: UUID):
+    """Return company, matched industry, and current Org-AI-R in one call.
+
+    Replaces the UI's separate GET company, GET industries, and GET org-air round trips.
+    `org_air` is null when the company cannot be scored yet (e.g. no dimension scores).
+    """
+    db = get_snowflake_service()
+    cid = str(company_id)
+    co = db.execute_one(
+        """
+        SELECT c.id, c.name, c.ticker, c.industry_id,
+               i.name AS industry_name, i.sector AS industry_sector
+        FROM companies c
+        LEFT JOIN industries i ON i.id = c.industry_id
+        WHERE c.id = %s AND c.is_deleted = FALSE
+        """,
+        (cid,),
+    )
+    if not co:
+        raise HTTPException(status_code=404, detail=f"Company {company_id} not found")
+
+    # Same mapping as get_org_air: ValueError means the company cannot be scored yet;
+    # anything else (DB/engine failure) propagates instead of masquerading as "not scored"
+    try:
+        org_air = _to_response(OrgAIRPipeline().run(cid, db))
+    except ValueError:
+        org_air = None
+
+    return PrefillResponse(
+        company_id=company_id,
+        ticker=co["ticker"],
+        company_name=co["name"],
+        industry_id=co.get("industry_id"),
+        industry_name=co.get("industry_name"),
+        industry_sector=co.get("industry_sector"),
+        org_air=org_air,
+    )
+
+
 @router.get(
     "/org-air",
     response_model=list[OrgAIRResponse],
@@ -97,12 +97,21 @@ async def collect_signals_all(
 
 
 @router.get("/signals/collect/logs/{task_id}")
-async def get_signal_collect_logs(task_id: str):
+async def get_signal_collect_logs(
+    task_id: str,
+    since: int = Query(0, ge=0, description="Return only lines after this cursor (next_cursor of the previous call)"),
+):
     """Get log lines for a signal collection task (for UI scrollable log view)."""
     if task_id not in _SIGNAL_TASK_LOGS:
-        return {"task_id": task_id, "logs": [], "finished": False}
+        return {"task_id": task_id, "logs": [], "next_cursor": 0, "finished": False}
     entry = _SIGNAL_TASK_LOGS[task_id]
-    return {"task_id": task_id, "logs": entry["lines"], "finished": entry["finished"]}
+    lines = entry["lines"]
+    return {
+        "task_id": task_id,
+        "logs": lines[since:],
+        "next_cursor": len(lines),
+        "finished": entry["finished"],
+    }
 
 
 # --- Formulas (for UI display) ---
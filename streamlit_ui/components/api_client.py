@@ -1,84 +1,283 @@
 """HTTP client for FastAPI evidence collection endpoints."""
-from typing import Any, Optional
+import asyncio
+import copy
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Optional, TypeVar
 from uuid import UUID
 
 import httpx
+import streamlit as st
 
 from streamlit_ui.utils.config import get_api_url, get_api_timeout
 
+T = TypeVar("T")
+
+# Conditional-GET store shared by the cached helpers: (base_url, path, params) -> (etag, json).
+# LRU-bounded; shared by every session/thread, so access goes through _ETAG_LOCK.
+_ETAG_CACHE_MAX = 256
+_ETAG_CACHE: "OrderedDict[tuple, tuple[str, Any]]" = OrderedDict()
+_ETAG_LOCK = threading.Lock()
+
 
 def get_client(base_url: Optional[str] = None) -> httpx.Client:
     """Return an httpx client with base URL. Timeout from config (default 60s for hosted backend)."""
     url = (base_url or get_api_url()).rstrip("/")
-    return httpx.Client(base_url=url, timeout=get_api_timeout())
+    return httpx.Client(
+        base_url=url,
+        timeout=get_api_timeout(),
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=100, keepalive_expiry=60),
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _shared_client(url: str) -> httpx.Client:
+    """Cached factory behind get_shared_client, keyed on the resolved base URL."""
+    return get_client(url)
+
+
+def get_shared_client(base_url: Optional[str] = None) -> httpx.Client:
+    """
+    Process-wide pooled client (one per base URL), kept alive across reruns so calls reuse
+    open connections. Do not close it; pass it to helpers as client=.
+    base_url defaults to the configured API URL and is resolved before the cache lookup, so
+    get_shared_client() and get_shared_client(get_api_url()) share one pool.
+    """
+    return _shared_client((base_url or get_api_url()).rstrip("/"))
+
 
+def with_client(fn: Callable[..., T]) -> Callable[..., T]:
+    """
+    Decorate an endpoint helper so client is optional: when none is passed (positionally or by
+    keyword), the pooled get_shared_client() is used so the call reuses open connections.
+    """
+    sig = inspect.signature(fn)
 
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        bound = sig.bind(*args, **kwargs)
+        if bound.arguments.get("client") is not None:
+            return fn(*args, **kwargs)
+        bound.arguments["client"] = get_shared_client()
+        return fn(*bound.args, **bound.kwargs)
+
+    return wrapper
+
+
+def get_async_client(base_url: Optional[str] = None) -> httpx.AsyncClient:
+    """Return an httpx async client with base URL (used by run_parallel for concurrent fan-out)."""
+    url = (base_url or get_api_url()).rstrip("/")
+    return httpx.AsyncClient(
+        base_url=url,
+        timeout=get_api_timeout(),
+        limits=httpx.Limits(max_connections=40, max_keepalive_connections=20, keepalive_expiry=60),
+    )
+
+
+def run_parallel(
+    *calls: Callable[..., Awaitable[Any]],
+    return_exceptions: bool = False,
+) -> list[Any]:
+    """
+    Run independent async helpers concurrently on one AsyncClient; results are returned in call order.
+    Each call is invoked as call(client=<AsyncClient>), e.g. run_parallel(partial(aget_org_air, cid), ...).
+    """
+    async def _gather() -> list[Any]:
+        async with get_async_client() as c:
+            return await asyncio.gather(
+                *(call(client=c) for call in calls), return_exceptions=return_exceptions
+            )
+
+    return asyncio.run(_gather())
+
+
+def _client_cache_key(client: httpx.Client) -> str:
+    return str(client.base_url)
+
+
+def cached_get(ttl: int):
+    """Memoize a read-only GET helper for ttl seconds (st.cache_data). A client argument is keyed by its base URL."""
+    return st.cache_data(ttl=ttl, show_spinner=False, hash_funcs={httpx.Client: _client_cache_key})
+
+
+def _get_json(c: httpx.Client, path: str, params: Optional[dict[str, Any]] = None) -> Any:
+    """
+    GET path and return JSON; revalidates with If-None-Match so unchanged data costs a bodyless 304.
+    Callers always get their own copy, so mutating a result never changes what later calls see.
+    """
+    key = (str(c.base_url), path, tuple(sorted((params or {}).items())))
+    with _ETAG_LOCK:
+        cached = _ETAG_CACHE.get(key)
+        if cached:
+            _ETAG_CACHE.move_to_end(key)
+    r = c.get(path, params=params, headers={"If-None-Match": cached[0]} if cached else None)
+    if r.status_code == 304 and cached:
+        return copy.deepcopy(cached[1])
+    r.raise_for_status()
+    data = r.json()
+    etag = r.headers.get("etag")
+    if etag:
+        with _ETAG_LOCK:
+            _ETAG_CACHE[key] = (etag, copy.deepcopy(data))
+            _ETAG_CACHE.move_to_end(key)
+            while len(_ETAG_CACHE) > _ETAG_CACHE_MAX:
+                _ETAG_CACHE.popitem(last=False)
+    return data
+
+
+class ConflictError(Exception):
+    """The API rejected a write with 409 Conflict (e.g. duplicate ticker on create_company)."""
+
+    def __init__(self, detail: Any = None):
+        super().__init__(detail or "Conflict")
+        self.detail = detail
+
+
+class BatchCallError(Exception):
+    """A call inside a POST /api/v1/batch request returned an error status."""
+
+    def __init__(self, method: str, path: str, status: int, detail: Any = None):
+        super().__init__(f"{method} {path} failed with status {status}: {detail}")
+        self.status = status
+        self.detail = detail
+
+
+class BatchBuilder:
+    """
+    Queue API calls and send them as one POST /api/v1/batch. add() returns a Future that is
+    resolved (or failed with BatchCallError) on flush(); used as a context manager it flushes on exit.
+    The server runs calls in order, so dependent calls (write, then read) can share one round trip.
+    """
+
+    def __init__(self, client: Optional[httpx.Client] = None):
+        self._client = client
+        self._calls: list[dict[str, Any]] = []
+        self._futures: list[Future] = []
+
+    def add(
+        self,
+        method: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        json: Any = None,
+    ) -> Future:
+        call: dict[str, Any] = {"method": method.upper(), "path": path}
+        if params:
+            call["params"] = params
+        if json is not None:
+            call["body"] = json
+        fut: Future = Future()
+        self._calls.append(call)
+        self._futures.append(fut)
+        return fut
+
+    def flush(self) -> None:
+        """Send queued calls in one request and resolve their futures."""
+        if not self._calls:
+            return
+        calls, futures = self._calls, self._futures
+        self._calls, self._futures = [], []
+        c = self._client or get_shared_client()
+        try:
+            r = c.post("/api/v1/batch", json={"calls": calls})
+            r.raise_for_status()
+            results = r.json().get("results") or []
+        except Exception as e:
+            for fut in futures:
+                fut.set_exception(e)
+            return
+        for call, fut, res in zip(calls, futures, results):
+            status = int(res.get("status", 500))
+            payload = res.get("json")
+            if status >= 400:
+                detail = payload.get("detail", payload) if isinstance(payload, dict) else payload
+                fut.set_exception(BatchCallError(call["method"], call["path"], status, detail))
+            else:
+                fut.set_result(payload)
+        for fut in futures[len(results):]:
+            fut.set_exception(BatchCallError("BATCH", "/api/v1/batch", 500, "missing result"))
+
+    def __enter__(self) -> "BatchBuilder":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.flush()
+
+
+@cached_get(ttl=30)
+@with_client
 def get_evidence_stats(client: Optional[httpx.Client] = None) -> dict[str, Any]:
-    """GET /api/v1/evidence/stats."""
-    c = client or get_client()
-    if not client:
-        c = get_client()
-    try:
-        r = c.get("/api/v1/evidence/stats")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    """GET /api/v1/evidence/stats (cached 30s)."""
+    r = client.get("/api/v1/evidence/stats")
+    r.raise_for_status()
+    return r.json()
 
 
+@cached_get(ttl=300)
+@with_client
 def get_target_companies(client: Optional[httpx.Client] = None) -> dict[str, Any]:
-    """GET /api/v1/target-companies."""
-    c = client or get_client()
-    try:
-        r = c.get("/api/v1/target-companies")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    """GET /api/v1/target-companies (cached 5 min)."""
+    return _get_json(client, "/api/v1/target-companies")
 
 
+@cached_get(ttl=60)
+@with_client
 def get_companies(
     client: Optional[httpx.Client] = None,
     page: int = 1,
     page_size: int = 100,
+    fields: Optional[str] = None,
+    expand: Optional[str] = None,
 ) -> dict[str, Any]:
-    """GET /api/v1/companies (list with id, ticker, name for Evidence dropdown)."""
-    c = client or get_client()
-    try:
-        r = c.get("/api/v1/companies", params={"page": page, "page_size": page_size})
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    """
+    GET /api/v1/companies (list with id, ticker, name for Evidence dropdown). Cached 60s; cleared on create/update/delete.
+    fields: optional comma-separated projection, e.g. "id,ticker,name".
+    expand: "industry" adds industry_name to each item.
+    """
+    params: dict[str, Any] = {"page": page, "page_size": page_size}
+    if fields:
+        params["fields"] = fields
+    if expand:
+        params["expand"] = expand
+    return _get_json(client, "/api/v1/companies", params=params)
 
 
+def iter_companies(
+    client: Optional[httpx.Client] = None,
+    page_size: int = 100,
+    fields: Optional[str] = "id,ticker,name",
+) -> Iterator[dict[str, Any]]:
+    """Yield every company across all pages of GET /api/v1/companies (page_size is capped at 100 by the API)."""
+    page = 1
+    while True:
+        data = get_companies(client, page=page, page_size=page_size, fields=fields)
+        items = data.get("items") or []
+        yield from items
+        if len(items) < page_size or page >= (data.get("total_pages") or page):
+            return
+        page += 1
+
+
+@cached_get(ttl=300)
+@with_client
 def get_industries(client: Optional[httpx.Client] = None) -> list[dict[str, Any]]:
-    """GET /api/v1/industries. Returns list of { id, name, sector }."""
-    c = client or get_client()
-    try:
-        r = c.get("/api/v1/industries")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    """GET /api/v1/industries. Returns list of { id, name, sector } (cached 5 min)."""
+    return _get_json(client, "/api/v1/industries")
 
 
+@with_client
 def get_company(company_id: str | UUID, client: Optional[httpx.Client] = None) -> dict[str, Any]:
     """GET /api/v1/companies/{company_id}."""
-    c = client or get_client()
-    try:
-        r = c.get(f"/api/v1/companies/{company_id}")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.get(f"/api/v1/companies/{company_id}")
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def create_company(
     name: str,
     ticker: str,
@@ -91,8 +290,7 @@ def create_company(
     leadership_url: Optional[str] = None,
     glassdoor_company_id: Optional[str] = None,
 ) -> dict[str, Any]:
-    """POST /api/v1/companies. Returns created company. Raises on 409 (duplicate ticker)."""
-    c = client or get_client()
+    """POST /api/v1/companies. Returns created company. Raises ConflictError on 409 (duplicate ticker)."""
     body: dict[str, Any] = {
         "name": name,
         "ticker": (ticker or "").strip().upper(),
@@ -109,15 +307,16 @@ def create_company(
         body["leadership_url"] = leadership_url
     if glassdoor_company_id is not None:
         body["glassdoor_company_id"] = glassdoor_company_id
-    try:
-        r = c.post("/api/v1/companies", json=body)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.post("/api/v1/companies", json=body)
+    if r.status_code == 409:
+        raise ConflictError(r.json().get("detail"))
+    r.raise_for_status()
+    get_companies.clear()
+    get_ticker_index.clear()
+    return r.json()
 
 
+@with_client
 def update_company(
     company_id: str | UUID,
     client: Optional[httpx.Client] = None,
@@ -132,7 +331,6 @@ def update_company(
     glassdoor_company_id: Optional[str] = None,
 ) -> dict[str, Any]:
     """PUT /api/v1/companies/{company_id}. Only include fields to update."""
-    c = client or get_client()
     body: dict[str, Any] = {}
     if name is not None:
         body["name"] = name
@@ -152,42 +350,65 @@ def update_company(
         body["leadership_url"] = leadership_url
     if glassdoor_company_id is not None:
         body["glassdoor_company_id"] = glassdoor_company_id
-    try:
-        r = c.put(f"/api/v1/companies/{company_id}", json=body)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.put(f"/api/v1/companies/{company_id}", json=body)
+    r.raise_for_status()
+    get_companies.clear()
+    get_ticker_index.clear()
+    return r.json()
 
 
+@with_client
 def delete_company(company_id: str | UUID, client: Optional[httpx.Client] = None) -> None:
     """DELETE /api/v1/companies/{company_id} (soft delete)."""
-    c = client or get_client()
-    try:
-        r = c.delete(f"/api/v1/companies/{company_id}")
-        r.raise_for_status()
-    finally:
-        if not client:
-            c.close()
+    r = client.delete(f"/api/v1/companies/{company_id}")
+    r.raise_for_status()
+    get_companies.clear()
+    get_ticker_index.clear()
+
+
+def build_ticker_index(
+    items: Iterable[dict[str, Any]],
+) -> tuple[dict[str, str], list[str], dict[str, str]]:
+    """
+    One pass over company items -> (ticker -> company_id, ticker options with '' first,
+    ticker -> 'TICKER — Name' for format_func). Items without a ticker or id are skipped.
+    """
+    ticker_to_id: dict[str, str] = {}
+    options = [""]
+    labels: dict[str, str] = {}
+    for c in items:
+        t = str(c.get("ticker") or "")
+        if not t or not c.get("id"):
+            continue
+        ticker_to_id[t] = str(c["id"])
+        options.append(t)
+        labels[t] = f"{t} — {c.get('name', t)}"
+    return ticker_to_id, options, labels
+
+
+@st.cache_data(ttl=120, show_spinner=False)
+def get_ticker_index(api_url: str) -> tuple[dict[str, str], list[str], dict[str, str]]:
+    """build_ticker_index over all companies at api_url (cached 2 min; cleared on create/update/delete)."""
+    return build_ticker_index(iter_companies(get_shared_client(api_url)))
+
+
+def _api_url(client: Optional[httpx.Client] = None) -> str:
+    return (str(client.base_url) if client else get_api_url()).rstrip("/")
 
 
 def get_ticker_to_company_id(client: Optional[httpx.Client] = None) -> dict[str, str]:
     """Build ticker -> company_id (UUID string) from GET /api/v1/companies. Used to resolve ticker to ID."""
-    data = get_companies(client, page=1, page_size=100)
-    items = data.get("items") or []
-    return {str(c.get("ticker", "")): str(c["id"]) for c in items if c.get("id") and c.get("ticker")}
+    ticker_to_id, _, _ = get_ticker_index(_api_url(client))
+    return ticker_to_id
 
 
 def get_company_options(client: Optional[httpx.Client] = None) -> tuple[list[str], dict[str, str]]:
     """Return (ticker list with '' first, ticker -> 'TICKER — Name' for format_func). From API."""
-    data = get_companies(client, page=1, page_size=100)
-    items = data.get("items") or []
-    tickers = [str(c.get("ticker", "")) for c in items if c.get("ticker")]
-    labels = {t: f"{t} — {c.get('name', t)}" for c in items for t in [str(c.get("ticker", ""))] if t}
-    return ([""] + tickers, labels)
+    _, tickers, labels = get_ticker_index(_api_url(client))
+    return (tickers, labels)
 
 
+@with_client
 def get_documents(
     client: Optional[httpx.Client] = None,
     page: int = 1,
@@ -198,7 +419,6 @@ def get_documents(
     status: Optional[str] = None,
 ) -> dict[str, Any]:
     """GET /api/v1/documents with optional filters."""
-    c = client or get_client()
     params: dict[str, Any] = {"page": page, "page_size": page_size}
     if company_id is not None:
         params["company_id"] = str(company_id)
@@ -208,27 +428,20 @@ def get_documents(
         params["filing_type"] = filing_type
     if status:
         params["status"] = status
-    try:
-        r = c.get("/api/v1/documents", params=params)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.get("/api/v1/documents", params=params)
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def get_document(document_id: UUID, client: Optional[httpx.Client] = None) -> dict[str, Any]:
     """GET /api/v1/documents/{document_id}."""
-    c = client or get_client()
-    try:
-        r = c.get(f"/api/v1/documents/{document_id}")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.get(f"/api/v1/documents/{document_id}")
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def get_document_chunks(
     document_id: UUID,
     client: Optional[httpx.Client] = None,
@@ -237,19 +450,15 @@ def get_document_chunks(
     section: Optional[str] = None,
 ) -> dict[str, Any]:
     """GET /api/v1/documents/{document_id}/chunks."""
-    c = client or get_client()
     params: dict[str, Any] = {"page": page, "page_size": page_size}
     if section:
         params["section"] = section
-    try:
-        r = c.get(f"/api/v1/documents/{document_id}/chunks", params=params)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.get(f"/api/v1/documents/{document_id}/chunks", params=params)
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def collect_documents(
     company_id: str | UUID,
     filing_types: list[str],
@@ -257,166 +466,140 @@ def collect_documents(
     client: Optional[httpx.Client] = None,
 ) -> dict[str, Any]:
     """POST /api/v1/documents/collect. Triggers background document collection. Returns task_id, status, message."""
-    c = client or get_client()
     body: dict[str, Any] = {
         "company_id": str(company_id),
         "filing_types": filing_types,
         "years_back": years_back,
     }
-    try:
-        r = c.post("/api/v1/documents/collect", json=body)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.post("/api/v1/documents/collect", json=body)
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def collect_documents_all(
     filing_types: list[str],
     years_back: int = 3,
     client: Optional[httpx.Client] = None,
 ) -> dict[str, Any]:
     """POST /api/v1/documents/collect-all. Triggers document collection for all companies. Returns task_id, status, message."""
-    c = client or get_client()
     body: dict[str, Any] = {
         "filing_types": filing_types,
         "years_back": years_back,
     }
-    try:
-        r = c.post("/api/v1/documents/collect-all", json=body)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.post("/api/v1/documents/collect-all", json=body)
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def get_document_collection_logs(
     task_id: str,
     client: Optional[httpx.Client] = None,
+    since: int = 0,
 ) -> dict[str, Any]:
-    """GET /api/v1/documents/collect/logs/{task_id}. Returns { task_id, logs: list[str], finished: bool }."""
-    c = client or get_client()
-    try:
-        r = c.get(f"/api/v1/documents/collect/logs/{task_id}")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
-
-
-def get_backend_logs(client: Optional[httpx.Client] = None) -> dict[str, Any]:
-    """GET /api/v1/logs. Returns { lines: list[str], total: int }."""
-    c = client or get_client()
-    try:
-        r = c.get("/api/v1/logs")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
-
-
+    """
+    GET /api/v1/documents/collect/logs/{task_id}. Returns { task_id, logs: list[str], next_cursor: int, finished: bool }.
+    Pass since=<previous next_cursor> to receive only new lines.
+    """
+    r = client.get(f"/api/v1/documents/collect/logs/{task_id}", params={"since": since} if since else None)
+    r.raise_for_status()
+    return r.json()
+
+
+@with_client
+def get_backend_logs(client: Optional[httpx.Client] = None, since: int = 0) -> dict[str, Any]:
+    """
+    GET /api/v1/logs. Returns { lines: list[str], total: int, next_cursor: int }.
+    Pass since=<previous next_cursor> for only new lines. Not routed through _get_json: every new
+    cursor is a new key, so its ETag store would keep one log page per poll for the process lifetime.
+    """
+    r = client.get("/api/v1/logs", params={"since": since} if since else None)
+    r.raise_for_status()
+    return r.json()
+
+
+@with_client
 def collect_signals(
     company_id: str | UUID,
     categories: list[str],
     client: Optional[httpx.Client] = None,
 ) -> dict[str, Any]:
     """POST /api/v1/signals/collect. Triggers background signal collection. Returns task_id, status, message."""
-    c = client or get_client()
     body: dict[str, Any] = {
         "company_id": str(company_id),
         "categories": categories,
     }
-    try:
-        r = c.post("/api/v1/signals/collect", json=body)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.post("/api/v1/signals/collect", json=body)
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def collect_signals_all(
     categories: list[str],
     client: Optional[httpx.Client] = None,
 ) -> dict[str, Any]:
     """POST /api/v1/signals/collect-all. Triggers signal collection for all companies. Returns task_id, status, message."""
-    c = client or get_client()
     body: dict[str, Any] = {"categories": categories}
-    try:
-        r = c.post("/api/v1/signals/collect-all", json=body)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.post("/api/v1/signals/collect-all", json=body)
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def get_signal_collection_logs(
     task_id: str,
     client: Optional[httpx.Client] = None,
+    since: int = 0,
 ) -> dict[str, Any]:
-    """GET /api/v1/signals/collect/logs/{task_id}. Returns { task_id, logs: list[str], finished: bool }."""
-    c = client or get_client()
-    try:
-        r = c.get(f"/api/v1/signals/collect/logs/{task_id}")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    """
+    GET /api/v1/signals/collect/logs/{task_id}. Returns { task_id, logs: list[str], next_cursor: int, finished: bool }.
+    Pass since=<previous next_cursor> to receive only new lines.
+    """
+    r = client.get(f"/api/v1/signals/collect/logs/{task_id}", params={"since": since} if since else None)
+    r.raise_for_status()
+    return r.json()
 
 
+@st.cache_resource(show_spinner=False, hash_funcs={httpx.Client: _client_cache_key})
+@with_client
 def get_signal_formulas(client: Optional[httpx.Client] = None) -> dict[str, Any]:
-    """GET /api/v1/signals/formulas. Returns { formulas: dict[str, str] }."""
-    c = client or get_client()
-    try:
-        r = c.get("/api/v1/signals/formulas")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    """
+    GET /api/v1/signals/formulas. Returns { formulas: dict[str, str] }.
+    The table is a server constant, so one shared copy is kept per API URL for the process; treat it as read-only.
+    """
+    return _get_json(client, "/api/v1/signals/formulas")
 
 
+@with_client
 def compute_signals(
     company_id: str | UUID,
     categories: Optional[list[str]] = None,
     client: Optional[httpx.Client] = None,
 ) -> dict[str, Any]:
     """POST /api/v1/signals/compute. Returns { computed: list[str], message: str }."""
-    c = client or get_client()
     body: dict[str, Any] = {"company_id": str(company_id)}
     if categories is not None:
         body["categories"] = categories
-    try:
-        r = c.post("/api/v1/signals/compute", json=body)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.post("/api/v1/signals/compute", json=body)
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def put_raw_glassdoor_reviews(
     company_id: str | UUID,
     payload: list[Any] | dict[str, Any],
     client: Optional[httpx.Client] = None,
 ) -> dict[str, Any]:
     """PUT /api/v1/companies/{company_id}/raw/glassdoor_reviews. payload: list of review objects, or dict with 'reviews' key. Returns { stored, company_id, message }."""
-    c = client or get_client()
-    try:
-        r = c.put(f"/api/v1/companies/{company_id}/raw/glassdoor_reviews", json=payload)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.put(f"/api/v1/companies/{company_id}/raw/glassdoor_reviews", json=payload)
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def get_signals(
     client: Optional[httpx.Client] = None,
     page: int = 1,
@@ -425,51 +608,40 @@ def get_signals(
     category: Optional[str] = None,
 ) -> dict[str, Any]:
     """GET /api/v1/signals."""
-    c = client or get_client()
     params: dict[str, Any] = {"page": page, "page_size": page_size}
     if company_id is not None:
         params["company_id"] = str(company_id)
     if category:
         params["category"] = category
-    try:
-        r = c.get("/api/v1/signals", params=params)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.get("/api/v1/signals", params=params)
+    r.raise_for_status()
+    return r.json()
 
 
+@cached_get(ttl=15)
+@with_client
 def get_company_signal_summary(
     company_id: UUID, client: Optional[httpx.Client] = None
 ) -> Optional[dict[str, Any]]:
-    """GET /api/v1/companies/{company_id}/signals."""
-    c = client or get_client()
-    try:
-        r = c.get(f"/api/v1/companies/{company_id}/signals")
-        if r.status_code == 404:
-            return None
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    """GET /api/v1/companies/{company_id}/signals (cached 15s; cleared after a compute)."""
+    r = client.get(f"/api/v1/companies/{company_id}/signals")
+    if r.status_code == 404:
+        return None
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def get_company_evidence(
     company_id: UUID, client: Optional[httpx.Client] = None
 ) -> dict[str, Any]:
     """GET /api/v1/companies/{company_id}/evidence."""
-    c = client or get_client()
-    try:
-        r = c.get(f"/api/v1/companies/{company_id}/evidence")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.get(f"/api/v1/companies/{company_id}/evidence")
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def post_backfill(
     tickers: Optional[list[str]] = None,
     include_documents: bool = True,
@@ -479,7 +651,6 @@ def post_backfill(
     client: Optional[httpx.Client] = None,
 ) -> dict[str, Any]:
     """POST /api/v1/evidence/backfill."""
-    c = client or get_client()
     body: dict[str, Any] = {
         "include_documents": include_documents,
         "include_signals": include_signals,
@@ -489,55 +660,61 @@ def post_backfill(
         body["tickers"] = tickers
     if filing_types is not None:
         body["filing_types"] = filing_types
-    try:
-        r = c.post("/api/v1/evidence/backfill", json=body)
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.post("/api/v1/evidence/backfill", json=body)
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def post_score_by_ticker(
     ticker: str,
     client: Optional[httpx.Client] = None,
 ) -> dict[str, Any]:
     """POST /api/v1/scores/score-by-ticker. Runs ScoringIntegrationService, returns Org-AI-R result."""
-    c = client or get_client()
-    try:
-        r = c.post("/api/v1/scores/score-by-ticker", json={"ticker": (ticker or "").strip().upper()})
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.post("/api/v1/scores/score-by-ticker", json={"ticker": (ticker or "").strip().upper()})
+    r.raise_for_status()
+    return r.json()
 
 
+@with_client
 def get_org_air(
     company_id: str | UUID,
     client: Optional[httpx.Client] = None,
 ) -> dict[str, Any]:
     """GET /api/v1/scores/companies/{company_id}/org-air. Returns current Org-AI-R result."""
-    c = client or get_client()
-    try:
-        r = c.get(f"/api/v1/scores/companies/{company_id}/org-air")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.get(f"/api/v1/scores/companies/{company_id}/org-air")
+    r.raise_for_status()
+    return r.json()
+
 
+@with_client
+def get_prefill_bundle(
+    company_id: str | UUID,
+    client: Optional[httpx.Client] = None,
+) -> dict[str, Any]:
+    """GET /api/v1/scores/companies/{company_id}/prefill. Company, its industry, and org_air (or null) in one call."""
+    r = client.get(f"/api/v1/scores/companies/{company_id}/prefill")
+    r.raise_for_status()
+    return r.json()
 
+
+@with_client
 def get_dimension_scores(
     company_id: str | UUID,
     client: Optional[httpx.Client] = None,
 ) -> list[dict[str, Any]]:
     """GET /api/v1/scores/companies/{company_id}/dimension-scores. Returns list of dimension score rows."""
-    c = client or get_client()
-    try:
-        r = c.get(f"/api/v1/scores/companies/{company_id}/dimension-scores")
-        r.raise_for_status()
-        return r.json()
-    finally:
-        if not client:
-            c.close()
+    r = client.get(f"/api/v1/scores/companies/{company_id}/dimension-scores")
+    r.raise_for_status()
+    return r.json()
+
+
+# --- Async counterparts (for concurrent fan-out via run_parallel) ---
+
+
+async def aget_org_air(company_id: str | UUID, client: httpx.AsyncClient) -> dict[str, Any]:
+    """Async GET /api/v1/scores/companies/{company_id}/org-air."""
+    r = await client.get(f"/api/v1/scores/companies/{company_id}/org-air")
+    r.raise_for_status()
+    return r.json()
+
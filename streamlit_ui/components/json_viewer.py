@@ -6,19 +6,18 @@ from typing import Any
 
 def render_json(data: Any, label: str = "View as JSON", expanded: bool = False) -> None:
     """
-    Render dict/list as JSON in an expander (st.json + optional code block).
+    Render dict/list as JSON in an expander (st.json; raw text only when "Show raw text" is toggled on).
     Use for "View as JSON" next to formatted views.
     """
     if data is None:
         st.caption("No data")
         return
-    try:
-        if isinstance(data, (dict, list)):
-            json_str = json.dumps(data, indent=2, default=str)
-        else:
-            json_str = str(data)
-    except (TypeError, ValueError):
-        json_str = str(data)
+    is_json = isinstance(data, (dict, list))
     with st.expander(label, expanded=expanded):
-        st.json(data if isinstance(data, (dict, list)) else {"raw": json_str})
-        st.code(json_str, language="json")
+        st.json(data if is_json else {"raw": str(data)})
+        if st.toggle("Show raw text", key=f"{label}_raw"):
+            try:
+                json_str = json.dumps(data, indent=2, default=str) if is_json else str(data)
+            except (TypeError, ValueError):
+                json_str = str(data)
+            st.code(json_str, language="json")
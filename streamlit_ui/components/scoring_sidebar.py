@@ -1,14 +1,21 @@
 """Shared scoring sidebar: company selector and Run Pipeline button. Writes session state for scoring views."""
-from typing import Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, TypeVar
+from uuid import UUID
 
 import streamlit as st
 
 from streamlit_ui.components.api_client import (
-    get_client,
+    BatchBuilder,
     get_companies,
-    get_dimension_scores,
-    post_score_by_ticker,
+    get_company_evidence,
+    get_shared_client,
+    get_ticker_index,
 )
+from streamlit_ui.utils.config import get_api_url
+
+T = TypeVar("T")
 
 
 # Session state keys
@@ -17,6 +24,65 @@ KEY_COMPANY_ID = "scoring_selected_company_id"
 KEY_LAST_RESULT = "scoring_last_result"
 KEY_DIMENSION_DETAILS = "scoring_dimension_details"
 KEY_PIPELINE_MESSAGE = "scoring_pipeline_message"
+KEY_PREFETCH = "_prefetch"
+
+# Reads started in the background when a company is selected: name -> helper(company_id, client=)
+_PREFETCH_ENDPOINTS: dict[str, Callable[..., Any]] = {
+    "evidence": get_company_evidence,
+}
+# Prefetched results older than this (seconds since submit) are discarded instead of served
+_PREFETCH_MAX_AGE = 60.0
+
+
+@st.cache_resource
+def _prefetch_pool() -> ThreadPoolExecutor:
+    """Worker pool for background prefetches (one per server process)."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def _start_prefetch(company_id: str) -> None:
+    """
+    Submit the prefetch reads for company_id; futures for other companies or older than
+    _PREFETCH_MAX_AGE are dropped. The worker gets the shared client, so it makes no Streamlit calls.
+    """
+    now = time.monotonic()
+    futures = {
+        k: (submitted, f)
+        for k, (submitted, f) in st.session_state.get(KEY_PREFETCH, {}).items()
+        if k[1] == company_id and now - submitted <= _PREFETCH_MAX_AGE
+    }
+    client = get_shared_client(get_api_url())
+    for name, fn in _PREFETCH_ENDPOINTS.items():
+        if (name, company_id) not in futures:
+            fut = _prefetch_pool().submit(fn, UUID(company_id), client=client)
+            futures[(name, company_id)] = (now, fut)
+    st.session_state[KEY_PREFETCH] = futures
+
+
+def _on_company_change(ticker_to_id: dict[str, str]) -> None:
+    """Selectbox callback: prefetch only when the selection changes, not on every rerun."""
+    company_id = ticker_to_id.get(st.session_state.get("scoring_company_select") or "")
+    if company_id:
+        _start_prefetch(company_id)
+    else:
+        st.session_state.pop(KEY_PREFETCH, None)
+
+
+def get_prefetched(name: str, company_id: str, fallback: Callable[[], T]) -> T:
+    """
+    Return the prefetched result for (name, company_id), waiting on it if still in flight.
+    Falls back to calling fallback() when nothing was prefetched, the prefetch is older than
+    _PREFETCH_MAX_AGE, or it failed. The result is consumed, so the next call fetches fresh data.
+    """
+    entry = st.session_state.get(KEY_PREFETCH, {}).pop((name, company_id), None)
+    if entry is not None:
+        submitted, fut = entry
+        if time.monotonic() - submitted <= _PREFETCH_MAX_AGE:
+            try:
+                return fut.result()
+            except Exception:
+                pass
+    return fallback()
 
 
 def init_scoring_session_state() -> None:
@@ -42,25 +108,23 @@ def render_scoring_sidebar() -> None:
     init_scoring_session_state()
 
     st.sidebar.subheader("Scoring")
-    client = get_client()
-
+    if st.sidebar.button("Refresh companies", key="scoring_refresh_companies"):
+        get_ticker_index.clear()
+        get_companies.clear()
     try:
-        data = get_companies(client, page=1, page_size=100)
+        # Cached per API URL; shared with get_company_options/get_ticker_to_company_id
+        ticker_to_id, ticker_options, ticker_labels = get_ticker_index(get_api_url().rstrip("/"))
     except Exception:
         st.sidebar.caption("Could not load companies. Is the API running?")
-        client.close()
         return
 
-    items = data.get("items") or []
-    ticker_to_id = {str(c.get("ticker", "")): str(c["id"]) for c in items if c.get("id") and c.get("ticker")}
-    ticker_options = [""] + [str(c.get("ticker", "")) for c in items if c.get("ticker")]
-    ticker_labels = {t: f"{t} — {next((c.get('name', t) for c in items if str(c.get('ticker', '')) == t), t)}" for t in ticker_options if t}
-
     selected = st.sidebar.selectbox(
         "Company (ticker)",
         ticker_options,
         format_func=lambda x: "Select..." if not x else ticker_labels.get(x, x),
         key="scoring_company_select",
+        on_change=_on_company_change,
+        args=(ticker_to_id,),
     )
 
     if selected:
@@ -76,11 +140,21 @@ def render_scoring_sidebar() -> None:
         st.session_state[KEY_PIPELINE_MESSAGE] = None
         st.session_state[KEY_LAST_RESULT] = None
         st.session_state[KEY_DIMENSION_DETAILS] = None
+        # The pipeline changes the company's data, so anything prefetched before it is stale
+        st.session_state.pop(KEY_PREFETCH, None)
         with st.sidebar.spinner("Running pipeline..."):
             try:
-                result = post_score_by_ticker(ticker, client=client)
+                # One round trip: the batch runs score-by-ticker, then reads the fresh dimension scores
+                with BatchBuilder() as batch:
+                    result_fut = batch.add(
+                        "POST", "/api/v1/scores/score-by-ticker", json={"ticker": ticker.strip().upper()}
+                    )
+                    dims_fut = batch.add(
+                        "GET", f"/api/v1/scores/companies/{st.session_state[KEY_COMPANY_ID]}/dimension-scores"
+                    )
+                result = result_fut.result()
                 st.session_state[KEY_LAST_RESULT] = result
-                dim_list = get_dimension_scores(st.session_state[KEY_COMPANY_ID], client=client)
+                dim_list = dims_fut.result()
                 st.session_state[KEY_DIMENSION_DETAILS] = dim_list if isinstance(dim_list, list) else []
                 st.session_state[KEY_PIPELINE_MESSAGE] = ("success", f"Pipeline completed for {ticker}.")
             except Exception as e:
@@ -94,8 +168,6 @@ def render_scoring_sidebar() -> None:
         else:
             st.sidebar.error(text)
 
-    client.close()
-
 
 def get_last_result() -> Optional[dict[str, Any]]:
     """Return last pipeline result from session state."""
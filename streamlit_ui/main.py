@@ -9,23 +9,14 @@ import sys
 from pathlib import Path
 
 # Ensure project root is on path when run as "streamlit run main.py" from streamlit_ui/
-_root = Path(__file__).resolve().parent.parent
-if _root not in sys.path:
-    sys.path.insert(0, str(_root))
+# (sys.path holds strings, so compare the str form; a Path never matches and would insert on every rerun)
+_ROOT_STR = str(Path(__file__).resolve().parent.parent)
+if _ROOT_STR not in sys.path:
+    sys.path.insert(0, _ROOT_STR)
 
 import streamlit as st
 
-st.set_page_config(
-    page_title="PE Org-AI-R Platform",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="expanded",
-)
-
-st.title("PE Org-AI-R Platform")
-st.caption("AI Readiness Assessment for Private Equity — Scoring Flow & Evidence")
-
-st.markdown("""
+_INTRO_MD = """
 **What companies say (SEC filings) vs. what they do (external signals).**
 
 Use the **sidebar** to open:
@@ -44,6 +35,18 @@ Use the **sidebar** to open:
 - **Documents** — SEC filings list and detail
 - **Signals** — External signals, collect and compute
 - **Evidence** — Full evidence per company, backfill
-""")
+"""
+
+st.set_page_config(
+    page_title="PE Org-AI-R Platform",
+    page_icon="📊",
+    layout="wide",
+    initial_sidebar_state="expanded",
+)
+
+st.title("PE Org-AI-R Platform")
+st.caption("AI Readiness Assessment for Private Equity — Scoring Flow & Evidence")
+
+st.markdown(_INTRO_MD)
 
 st.info("Ensure the FastAPI backend is running (e.g. `poetry run uvicorn app.main:app --reload`) and set `STREAMLIT_API_URL` if needed.")
@@ -1,56 +1,152 @@
 """Companies: list, add, and update companies."""
+import math
+from collections import Counter
+
 import streamlit as st
 
 from streamlit_ui.components.api_client import (
-    get_client,
+    ConflictError,
     get_companies,
     get_company,
     get_industries,
+    get_shared_client,
     create_company,
     update_company,
     delete_company,
 )
 from streamlit_ui.utils.config import get_api_url
 
+# Streamlit version capabilities, resolved once at the top instead of with hasattr at each call site
+_RERUN = getattr(st, "rerun", None) or getattr(st, "experimental_rerun")
+_HAS_DIALOG = hasattr(st, "dialog")
+
 st.set_page_config(page_title="Companies | PE Org-AI-R", page_icon="🏢", layout="wide")
 st.title("Companies")
 st.caption("List, add, and update companies. Data is stored in the database.")
 
-api_url = get_api_url()
-client = get_client()
+# Result of the last add/update/delete, set just before its st.rerun() and shown once here
+flash = st.session_state.pop("flash", None)
+if flash:
+    kind, text = flash
+    if kind == "success":
+        st.success(text)
+    else:
+        st.error(text)
 
-try:
-    raw = get_industries(client)
+
+def _load_industries(api_url: str):
+    """
+    Add/Edit dropdown data derived from GET /api/v1/industries (cached 5 min by get_industries):
+    (industry_options, industry_labels, industry_ids, industry_idx_by_id).
+    Labels are unique: an industry name shared by several rows is shown as "Name (id)".
+    """
+    raw = get_industries(get_shared_client(api_url))
     industries = raw if isinstance(raw, list) else (raw.get("items") or raw.get("industries") or [])
-    industries_by_id = {str(i.get("id", "")): i for i in industries if i.get("id")}
-except Exception as e:
-    st.error(f"Cannot reach API at {api_url}. Is the backend running? Error: {e}")
-    st.stop()
+    industry_options = [(i.get("name", ""), i.get("id")) for i in industries if i.get("id") is not None]
+    name_counts = Counter(name for name, _ in industry_options)
+    industry_labels = [name if name_counts[name] == 1 else f"{name} ({iid})" for name, iid in industry_options]
+    industry_ids = [str(x[1]) for x in industry_options]
+    industry_idx_by_id = {iid: i for i, iid in enumerate(industry_ids)}
+    return industry_options, industry_labels, industry_ids, industry_idx_by_id
 
-industry_options = [(i.get("name", ""), i.get("id")) for i in industries if i.get("id") is not None]
-industry_labels = [x[0] for x in industry_options]
-industry_ids = [str(x[1]) for x in industry_options]
 
-# --- List companies ---
-st.subheader("All companies")
-# Add company button (opens modal when st.dialog available)
-col_btn, _ = st.columns([1, 5])
-with col_btn:
-    if st.button("Add company", type="primary", key="open_add_modal"):
-        st.session_state["show_add_company_modal"] = True
-        if hasattr(st, "rerun"):
-            st.rerun()
-        else:
-            st.experimental_rerun()
+PAGE_SIZE_OPTIONS = [10, 25, 50, 100]  # API caps page_size at 100
+
+
+# Button callbacks run before the script, so the modal/dialog blocks see the new state on this same run
+def _open_add_modal():
+    st.session_state["show_add_company_modal"] = True
+
+
+def _open_edit(company):
+    st.session_state["company_to_edit_id"] = str(company["id"])
+    st.session_state["edit_modal_open"] = True
+
+
+def _clear_edit_modal():
+    st.session_state["company_to_edit_id"] = None
+    st.session_state["edit_modal_open"] = False
+
+
+def _open_delete(company):
+    st.session_state["company_to_delete"] = {
+        "id": str(company["id"]),
+        "ticker": company.get("ticker") or "",
+        "name": company.get("name") or "",
+    }
+
+
+def _apply_inline_edits(rows, editor_key):
+    """Send one update_company per row changed in the data editor, then refresh the list."""
+    _, industry_labels, industry_ids, _ = _industry_choices()
+    industry_id_by_label = dict(zip(industry_labels, industry_ids))
+    updated, errors = 0, []
+    for idx, changes in (st.session_state[editor_key].get("edited_rows") or {}).items():
+        company = rows[int(idx)]
+        fields = {}
+        if "Name" in changes:
+            name = (changes["Name"] or "").strip()
+            if not name:
+                errors.append(f"{company.get('ticker', '')}: name cannot be blank")
+                continue
+            fields["name"] = name
+        if changes.get("Industry") in industry_id_by_label:
+            fields["industry_id"] = industry_id_by_label[changes["Industry"]]
+        if not fields:
+            continue
+        try:
+            update_company(company["id"], client=client, **fields)
+            updated += 1
+        except Exception as e:
+            errors.append(f"{company.get('ticker', '')}: {e}")
+    # New editor key so the next run starts from the refreshed rows, not the old edit deltas
+    st.session_state["companies_editor_version"] = st.session_state.get("companies_editor_version", 0) + 1
+    if errors:
+        st.session_state["flash"] = ("error", "Failed to update " + "; ".join(errors))
+    elif updated:
+        st.session_state["flash"] = ("success", f"Updated {updated} compan{'y' if updated == 1 else 'ies'}.")
+
+
+def _run_row_action(rows):
+    idx = st.session_state.get("row_action_target")
+    if idx is None or idx >= len(rows):
+        return
+    company = rows[idx]
+    if st.session_state["row_action_kind"] == "Edit":
+        _open_edit(company)
+    else:
+        _open_delete(company)
+
+
+def _reset_page():
+    st.session_state["companies_page"] = 1
+
+
+def _step_page(delta: int):
+    st.session_state["companies_page"] = st.session_state.get("companies_page", 1) + delta
+
+
+def _load_companies(api_url: str, page: int, page_size: int):
+    """(items, total) for one page of companies with industry_name (get_companies caches 60s; writes clear it)."""
+    data = get_companies(get_shared_client(api_url), page=page, page_size=page_size, expand="industry")
+    return data.get("items") or [], data.get("total", 0)
+
+
+api_url = get_api_url()
+client = get_shared_client(api_url)
+
+if st.sidebar.button("Refresh industries", key="refresh_industries"):
+    get_industries.clear()
+
+
+def _industry_choices():
+    """Cached industry dropdown data, loaded only where a dropdown needs it; empty if the API call fails."""
+    try:
+        return _load_industries(api_url)
+    except Exception as e:
+        st.warning(f"Could not load industries from {api_url}: {e}")
+        return [], [], [], {}
 
-try:
-    data = get_companies(client, page=1, page_size=100)
-    items = data.get("items") or []
-    total = data.get("total", 0)
-except Exception as e:
-    st.error(f"Failed to load companies: {e}")
-    items = []
-    total = 0
 
 # Delete confirmation as modal popup (st.dialog requires Streamlit 1.33+)
 def _render_delete_dialog(pending):
@@ -59,26 +155,21 @@ def _render_delete_dialog(pending):
     with col1:
         if st.button("Confirm delete", type="primary", key="confirm_delete"):
             try:
-                delete_company(pending["id"])
+                delete_company(pending["id"], client)
+                st.session_state["flash"] = ("success", f"Company {pending.get('ticker', '')} deleted.")
                 st.session_state["company_to_delete"] = None
-                if hasattr(st, "rerun"):
-                    st.rerun()
-                else:
-                    st.experimental_rerun()
+                _RERUN()
             except Exception as e:
                 st.error(f"Delete failed: {e}")
     with col2:
         if st.button("Cancel", key="cancel_delete"):
             st.session_state["company_to_delete"] = None
-            if hasattr(st, "rerun"):
-                st.rerun()
-            else:
-                st.experimental_rerun()
+            _RERUN()
 
 
 if "company_to_delete" in st.session_state and st.session_state["company_to_delete"]:
     pending = st.session_state["company_to_delete"]
-    if hasattr(st, "dialog"):
+    if _HAS_DIALOG:
         # Modal popup (Streamlit 1.33+): clear state when user closes dialog without confirming
         def _clear_pending():
             st.session_state["company_to_delete"] = None
@@ -89,65 +180,105 @@ if "company_to_delete" in st.session_state and st.session_state["company_to_dele
 
         _confirm_delete_modal()
     else:
-        # Fallback: inline confirmation for older Streamlit
+        # Fallback: inline confirmation for older Streamlit (stops before the list is fetched or rendered)
         _render_delete_dialog(pending)
         st.stop()
 
+# --- List companies ---
+st.subheader("All companies")
+# Add company button (opens modal when st.dialog available)
+col_btn, _ = st.columns([1, 5])
+with col_btn:
+    st.button("Add company", type="primary", key="open_add_modal", on_click=_open_add_modal)
+
+try:
+    page_size = st.session_state.get("companies_page_size", PAGE_SIZE_OPTIONS[1])
+    page = st.session_state.get("companies_page", 1)
+    items, total = _load_companies(api_url, page, page_size)
+    total_pages = max(math.ceil(total / page_size), 1)
+    if page > total_pages:
+        # e.g. the last row on the last page was deleted
+        page = st.session_state["companies_page"] = total_pages
+        items, total = _load_companies(api_url, page, page_size)
+except Exception as e:
+    st.error(f"Failed to load companies: {e}")
+    items = []
+    total = 0
+    page, total_pages = 1, 1
+items_by_id = {str(c["id"]): c for c in items if c.get("id")}
+
 if items:
-    # Table header
-    h1, h2, h3, h4 = st.columns([2, 3, 2, 2])
-    with h1:
-        st.markdown("**Ticker**")
-    with h2:
-        st.markdown("**Name**")
-    with h3:
-        st.markdown("**Industry**")
-    with h4:
-        st.markdown("**Actions**")
-    # Table rows: 3 columns (Ticker, Name, Industry) + 4th column (Edit | Delete)
-    for c in items:
-        cid = c.get("id")
-        if not cid:
-            continue
-        ind_id = c.get("industry_id")
-        industry_name = industries_by_id.get(str(ind_id), {}).get("name", "") if ind_id else ""
-        ticker = c.get("ticker") or ""
-        name = c.get("name") or ""
-        col1, col2, col3, col4 = st.columns([2, 3, 2, 2])
-        with col1:
-            st.text(ticker)
-        with col2:
-            st.text(name)
-        with col3:
-            st.text(industry_name)
-        with col4:
-            sub1, sub2 = st.columns(2)
-            with sub1:
-                if st.button("Edit", key=f"edit_{cid}"):
-                    st.session_state["company_to_edit_id"] = str(cid)
-                    if hasattr(st, "rerun"):
-                        st.rerun()
-                    else:
-                        st.experimental_rerun()
-            with sub2:
-                if st.button("Delete", key=f"delete_{cid}"):
-                    st.session_state["company_to_delete"] = {"id": str(cid), "ticker": ticker, "name": name}
-                    if hasattr(st, "rerun"):
-                        st.rerun()
-                    else:
-                        st.experimental_rerun()
-    st.caption(f"Total: {total} companies.")
+    # One table instead of a row of widgets per company; Name and Industry are edited in place
+    rows = [c for c in items if c.get("id")]
+    _, industry_labels, _, industry_idx_by_id = _industry_choices()
+    editor_key = f"companies_editor_{st.session_state.get('companies_editor_version', 0)}"
+    st.data_editor(
+        [
+            {
+                "Ticker": c.get("ticker") or "",
+                "Name": c.get("name") or "",
+                "Industry": (
+                    industry_labels[industry_idx_by_id[str(c.get("industry_id"))]]
+                    if str(c.get("industry_id")) in industry_idx_by_id
+                    else c.get("industry_name") or ""
+                ),
+            }
+            for c in rows
+        ],
+        column_config={
+            "Industry": st.column_config.SelectboxColumn("Industry", options=industry_labels, required=True),
+        },
+        disabled=["Ticker"] if industry_labels else ["Ticker", "Industry"],
+        num_rows="fixed",
+        use_container_width=True,
+        hide_index=True,
+        key=editor_key,
+        on_change=_apply_inline_edits,
+        args=(rows, editor_key),
+    )
+    # Row actions in one form: picking a company/action does not rerun the page, only "Go" does
+    with st.form("row_action"):
+        col_target, col_action, col_go = st.columns([4, 1, 1])
+        with col_target:
+            st.selectbox(
+                "Company",
+                range(len(rows)),
+                format_func=lambda i: f"{rows[i].get('ticker') or ''} — {rows[i].get('name') or ''}",
+                key="row_action_target",
+                label_visibility="collapsed",
+            )
+        with col_action:
+            st.selectbox("Action", ["Edit", "Delete"], key="row_action_kind", label_visibility="collapsed")
+        with col_go:
+            st.form_submit_button("Go", on_click=_run_row_action, args=(rows,))
+    col_prev, col_page, col_next, col_size = st.columns([1, 2, 1, 2])
+    with col_prev:
+        st.button("Prev", key="companies_prev", disabled=page <= 1, on_click=_step_page, args=(-1,))
+    with col_page:
+        st.caption(f"Page {page} of {total_pages} · {total} companies.")
+    with col_next:
+        st.button("Next", key="companies_next", disabled=page >= total_pages, on_click=_step_page, args=(1,))
+    with col_size:
+        st.selectbox(
+            "Rows per page",
+            PAGE_SIZE_OPTIONS,
+            index=PAGE_SIZE_OPTIONS.index(page_size),
+            key="companies_page_size",
+            on_change=_reset_page,
+            label_visibility="collapsed",
+        )
 else:
     st.caption("No companies yet. Click **Add company** to add one.")
 
 # --- Add company modal ---
-if st.session_state.get("show_add_company_modal") and hasattr(st, "dialog"):
+if st.session_state.get("show_add_company_modal") and _HAS_DIALOG:
 
     def _clear_add_modal():
         st.session_state["show_add_company_modal"] = False
 
     @st.dialog("Add company", dismissible=True, on_dismiss=_clear_add_modal)
     def _add_company_modal():
+        industry_options, industry_labels, industry_ids, _ = _industry_choices()
         with st.form("add_company_modal_form"):
             name = st.text_input("Name", placeholder="Acme Inc.")
             ticker = st.text_input("Ticker", placeholder="ACM")
@@ -173,65 +304,63 @@ if st.session_state.get("show_add_company_modal") and hasattr(st, "dialog"):
                 cancel = st.form_submit_button("Cancel")
             if cancel:
                 _clear_add_modal()
-                if hasattr(st, "rerun"):
-                    st.rerun()
-                else:
-                    st.experimental_rerun()
+                _RERUN()
             if submitted:
                 ticker_norm = (ticker or "").strip().upper()
-                if not name or not ticker_norm:
+                if not (name or "").strip() or not ticker_norm:
                     st.error("Name and Ticker are required.")
                 elif not industry_id:
                     st.error("Please select an industry.")
                 else:
                     try:
-                        create_company(
-                            name=name,
-                            ticker=ticker_norm,
-                            industry_id=industry_id,
-                            domain=domain or None,
-                            careers_url=careers_url or None,
-                            news_url=news_url or None,
-                            leadership_url=leadership_url or None,
-                            glassdoor_company_id=glassdoor_company_id.strip() or None,
-                        )
-                        st.success(f"Company {ticker_norm} added.")
+                        # Strip every text field once; empty optional fields are sent as None
+                        payload = {
+                            k: (v.strip() or None) if isinstance(v, str) else v
+                            for k, v in {
+                                "name": name,
+                                "ticker": ticker_norm,
+                                "industry_id": industry_id,
+                                "domain": domain,
+                                "careers_url": careers_url,
+                                "news_url": news_url,
+                                "leadership_url": leadership_url,
+                                "glassdoor_company_id": glassdoor_company_id,
+                            }.items()
+                        }
+                        create_company(**payload, client=client)
+                        st.session_state["flash"] = ("success", f"Company {ticker_norm} added.")
                         _clear_add_modal()
-                        if hasattr(st, "rerun"):
-                            st.rerun()
-                        else:
-                            st.experimental_rerun()
+                        _RERUN()
+                    except ConflictError:
+                        st.error("A company with this ticker already exists.")
                     except Exception as e:
-                        err = str(e)
-                        if "409" in err or "already exists" in err.lower():
-                            st.error("A company with this ticker already exists.")
-                        else:
-                            st.error(f"Failed to add company: {e}")
+                        st.error(f"Failed to add company: {e}")
 
     _add_company_modal()
 
 # --- Edit company modal ---
-edit_id = st.session_state.get("company_to_edit_id")
-if edit_id and hasattr(st, "dialog"):
-    try:
-        company = get_company(edit_id, client)
-    except Exception:
-        company = None
+# Only build the modal (lookup + form widgets) while it is open
+edit_id = st.session_state.get("company_to_edit_id") if st.session_state.get("edit_modal_open") else None
+if edit_id and _HAS_DIALOG:
+    # The list rows already carry every editable field; only fetch when the company is not on this page
+    company = items_by_id.get(str(edit_id))
+    if company is None:
+        try:
+            company = get_company(edit_id, client)
+        except Exception:
+            company = None
     if company:
 
-        def _clear_edit_modal():
-            if "company_to_edit_id" in st.session_state:
-                del st.session_state["company_to_edit_id"]
-
         @st.dialog("Edit company", dismissible=True, on_dismiss=_clear_edit_modal)
         def _edit_company_modal():
+            industry_options, industry_labels, industry_ids, industry_idx_by_id = _industry_choices()
             with st.form("edit_company_modal_form"):
                 st.caption(f"Editing: {company.get('ticker')} — {company.get('name')}")
                 upd_name = st.text_input("Name", value=company.get("name") or "")
                 st.text_input("Ticker (read-only)", value=company.get("ticker") or "", disabled=True, key="edit_ticker_ro")
                 cur_ind_id = str(company.get("industry_id") or "")
                 if industry_options:
-                    ind_sel = next((i for i, iid in enumerate(industry_ids) if str(iid) == cur_ind_id), 0)
+                    ind_sel = industry_idx_by_id.get(cur_ind_id, 0)
                     n = len(industry_labels)
                     upd_industry_idx = st.selectbox("Industry", range(n), index=min(ind_sel, n - 1), format_func=lambda i: industry_labels[i], key="upd_industry_modal")
                     upd_industry_id = industry_ids[upd_industry_idx]
@@ -256,34 +385,28 @@ if edit_id and hasattr(st, "dialog"):
                     cancel_clicked = st.form_submit_button("Cancel")
                 if cancel_clicked:
                     _clear_edit_modal()
-                    if hasattr(st, "rerun"):
-                        st.rerun()
-                    else:
-                        st.experimental_rerun()
+                    _RERUN()
                 if save_clicked:
                     try:
-                        update_company(
-                            edit_id,
-                            name=upd_name or None,
-                            industry_id=upd_industry_id,
-                            domain=upd_domain or None,
-                            careers_url=upd_careers_url or None,
-                            news_url=upd_news_url or None,
-                            leadership_url=upd_leadership_url or None,
-                            glassdoor_company_id=upd_glassdoor_company_id.strip() or None,
-                        )
-                        st.success("Company updated.")
+                        # Strip each text input once; empty fields are sent as None (left unchanged)
+                        fields = {
+                            k: v.strip() or None
+                            for k, v in {
+                                "name": upd_name,
+                                "domain": upd_domain,
+                                "careers_url": upd_careers_url,
+                                "news_url": upd_news_url,
+                                "leadership_url": upd_leadership_url,
+                                "glassdoor_company_id": upd_glassdoor_company_id,
+                            }.items()
+                        }
+                        update_company(edit_id, industry_id=upd_industry_id, client=client, **fields)
+                        st.session_state["flash"] = ("success", "Company updated.")
                         _clear_edit_modal()
-                        if hasattr(st, "rerun"):
-                            st.rerun()
-                        else:
-                            st.experimental_rerun()
+                        _RERUN()
                     except Exception as e:
                         st.error(f"Failed to update: {e}")
 
         _edit_company_modal()
     else:
-        if "company_to_edit_id" in st.session_state:
-            del st.session_state["company_to_edit_id"]
-
-client.close()
+        _clear_edit_modal()
@@ -1,18 +1,20 @@
 """Company Details: manual HR / V^R / Org-AI-R calculator with form inputs."""
 
-import matplotlib.pyplot as plt
+import warnings
+from typing import Optional
+
 import numpy as np
 import pandas as pd
 import streamlit as st
 
 from app.models.enums import Dimension
-from streamlit_ui.components.api_client import get_company, get_industries, get_org_air
+from streamlit_ui.components.api_client import get_prefill_bundle, get_shared_client
 from streamlit_ui.components.scoring_sidebar import (
     KEY_COMPANY_ID,
     KEY_TICKER,
-    get_client,
     render_scoring_sidebar,
 )
+from streamlit_ui.utils.config import get_api_url
 
 # Sector options for H^R baseline (match hr_calculator built-ins)
 SECTOR_OPTIONS = [
@@ -23,6 +25,7 @@ SECTOR_OPTIONS = [
     "retail",
     "manufacturing",
 ]
+_SECTOR_INDEX = {s: i for i, s in enumerate(SECTOR_OPTIONS)}
 # Map API industry.sector (e.g. "Financial") to SECTOR_OPTIONS value (same as backend _SECTOR_MAP)
 SECTOR_MAP = {
     "Technology": "technology",
@@ -35,89 +38,77 @@ SECTOR_MAP = {
     "Real Estate": "business_services",
 }
 DIMENSION_ORDER = list(Dimension)
+DIMENSION_VALUES = tuple(d.value for d in DIMENSION_ORDER)
+DIMENSION_TITLES = tuple(v.replace("_", " ").title() for v in DIMENSION_VALUES)
 DEFAULT_DIMENSION_SCORES = "70.0, 75.0, 68.0, 80.0, 72.0, 65.0, 70.0"
+# (sector, hr_baseline, company_name, industry_name) when no company data is available
+_NO_COMPANY_INFO = ("financial_services", 60.0, "", "")
+# Rerun only the calculator form/result on submit (st.fragment; experimental_ before 1.37)
+_fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda fn: fn)
+)
+# (company_id, prefill bundle) last fetched this session
+_CALC_BUNDLE_KEY = "_calc_prefill_bundle"
+# (company_id, prefill, form defaults) last computed this session
+_CALC_DEFAULTS_KEY = "_calc_form_defaults"
+# (raw string, parsed pairs) for the last dimension-score string parsed this session
+_DIM_PARSED_KEY = "_calc_dim_parsed"
+# Company whose prefill the form currently shows; form widget keys re-seeded when it changes
+_CALC_PREFILL_KEY = "calc_prefill_company_id"
+_CALC_KEYS = tuple(f"calc_dim_{dv}" for dv in DIMENSION_VALUES) + (
+    "calc_tc",
+    "calc_hr_baseline",
+    "calc_pf",
+    "calc_align",
+    "calc_timing",
+)
 
 # Two-sided z-values for supported confidence levels (no scipy)
 _Z_TABLE = {0.80: 1.2816, 0.90: 1.6449, 0.95: 1.9600, 0.99: 2.5758}
+_INV_SQRT_2PI = 0.3989422804014327  # 1 / sqrt(2 * pi)
+# CI width upper bounds (inclusive) for each reliability band, and the band's label/color
+_RELIABILITY_BANDS = (5.0, 15.0)
+_RELIABILITY_LABELS = (
+    ("High reliability (narrow CI)", "green"),
+    ("Moderate reliability", "darkorange"),
+    ("Low reliability (wide CI)", "red"),
+)
 
 
-def _plot_sem_bell_curve(
-    df: pd.DataFrame,
-    company_name: str,
-    conf_level: float = 0.95,
-    picked_date=None,
-):
-    """Plot a normal-distribution bell curve inferring SEM from a two-sided CI.
-
-    Parameters
-    ----------
-    df : DataFrame with columns COMPANY_NAME, ASSESSMENT_DATE, V_R_SCORE,
-         CONFIDENCE_LOWER, CONFIDENCE_UPPER, and optionally EVIDENCE_COUNT.
-    company_name : str — used to filter df and appears in the title.
-    conf_level : float — one of 0.80, 0.90, 0.95 (default), 0.99.
-    picked_date : optional date/str — selects a specific assessment row;
-                  defaults to the latest assessment.
-
-    Reliability interpretation
-    --------------------------
-    A narrower bell curve (small SEM / tight CI) means more evidence and
-    higher confidence in the V^R score. A wider curve signals fewer data
-    points and greater uncertainty.
-
-    Returns
-    -------
-    fig, ax : Matplotlib Figure and Axes.
-
-    Streamlit usage
-    ---------------
-    fig, ax = _plot_sem_bell_curve(df, company_name)
-    st.pyplot(fig)
-    """
+def _compute_bell(
+    mu: float, sem: float, x_min: float, x_max: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """X grid and normal PDF for the bell curve (not cached itself; only reached via _cached_bell_png)."""
+    # 201 points is visually indistinguishable from a denser grid at figsize=(9, 4)
+    # float32 is plenty for a plot and halves the memory moved per array op
+    x = np.linspace(x_min, x_max, 201, dtype=np.float32)
+    # Normal PDF (NumPy only, no scipy); scalar constants kept out of the array ops
+    mu32 = np.float32(mu)
+    inv_sem = np.float32(1.0 / sem)
+    norm_const = np.float32(inv_sem * _INV_SQRT_2PI)
+    u = (x - mu32) * inv_sem
+    pdf = norm_const * np.exp(np.float32(-0.5) * u * u)
+    return x, pdf
+
+
+def _draw_bell(
+    ax,
+    mu: float,
+    lower: float,
+    upper: float,
+    evidence_count: Optional[int],
+    conf_level: float,
+    title_prefix: str,
+) -> None:
+    """Draw the SEM bell curve, CI shading, and reliability/evidence badges onto ax."""
     z = _Z_TABLE.get(conf_level)
     if z is None:
         raise ValueError(
             f"conf_level must be one of {sorted(_Z_TABLE)}; got {conf_level!r}."
         )
 
-    # Filter to company
-    sub = df[df["COMPANY_NAME"] == company_name].copy()
-    if sub.empty:
-        raise ValueError(f"No rows found for company '{company_name!r}'.")
-
-    # Convert and sort dates
-    sub["ASSESSMENT_DATE"] = pd.to_datetime(sub["ASSESSMENT_DATE"])
-    sub = sub.sort_values("ASSESSMENT_DATE")
-
-    # Select row
-    if picked_date is not None:
-        picked_dt = pd.to_datetime(picked_date)
-        matches = sub[sub["ASSESSMENT_DATE"] == picked_dt]
-        if matches.empty:
-            raise ValueError(f"No assessment found for date '{picked_date}'.")
-        row = matches.iloc[0]
-    else:
-        row = sub.iloc[-1]  # latest
-
-    # Validate numeric columns
-    for col in ("V_R_SCORE", "CONFIDENCE_LOWER", "CONFIDENCE_UPPER"):
-        val = row[col]
-        if pd.isna(val):
-            raise ValueError(f"Column '{col}' is missing or NaN for the selected row.")
-        try:
-            float(val)
-        except (TypeError, ValueError):
-            raise ValueError(f"Column '{col}' must be numeric; got {val!r}.")
-
-    mu = float(row["V_R_SCORE"])
-    lower = float(row["CONFIDENCE_LOWER"])
-    upper = float(row["CONFIDENCE_UPPER"])
-    assessment_date = row["ASSESSMENT_DATE"].date()
-    evidence_count = (
-        int(row["EVIDENCE_COUNT"])
-        if "EVIDENCE_COUNT" in row.index and pd.notna(row["EVIDENCE_COUNT"])
-        else None
-    )
-
     if upper <= lower:
         raise ValueError(
             f"CONFIDENCE_UPPER ({upper}) must be strictly greater than "
@@ -129,24 +120,19 @@ def _plot_sem_bell_curve(
     sem = ci_width / (2.0 * z)
 
     # Reliability band: narrower CI = higher confidence in V^R score
-    if ci_width <= 5:
-        reliability_label, reliability_color = "High reliability (narrow CI)", "green"
-    elif ci_width <= 15:
-        reliability_label, reliability_color = "Moderate reliability", "darkorange"
-    else:
-        reliability_label, reliability_color = "Low reliability (wide CI)", "red"
+    band = int(np.searchsorted(_RELIABILITY_BANDS, ci_width, side="left"))
+    reliability_label, reliability_color = _RELIABILITY_LABELS[band]
 
     # X grid spanning slightly beyond the CI
     half_width = 0.5 * ci_width
     x_min = max(0.0, lower - half_width)
     x_max = min(100.0, upper + half_width)
-    x = np.linspace(x_min, x_max, 600)
-
-    # Normal PDF (NumPy only, no scipy)
-    pdf = (1.0 / (sem * np.sqrt(2.0 * np.pi))) * np.exp(-0.5 * ((x - mu) / sem) ** 2)
+    # Round so float jitter between reruns still hits the cache
+    x, pdf = _compute_bell(
+        round(mu, 6), round(sem, 6), round(x_min, 6), round(x_max, 6)
+    )
 
     # Plot
-    fig, ax = plt.subplots(figsize=(9, 4))
     ax.plot(x, pdf, color="steelblue", linewidth=2)
     ax.fill_between(
         x,
@@ -216,74 +202,109 @@ def _plot_sem_bell_curve(
     ax.set_xlabel("VR Score")
     ax.set_ylabel("Probability Density")
     ax.set_title(
-        f"{company_name}  |  {assessment_date}  |  "
-        f"{int(conf_level * 100)}% CI  |  SEM = {sem:.3f}",
+        f"{title_prefix}  |  {int(conf_level * 100)}% CI  |  SEM = {sem:.3f}",
         fontsize=11,
     )
     ax.legend(fontsize=9)
     ax.spines[["top", "right"]].set_visible(False)
-    plt.tight_layout()
+
+
+def _plot_sem_bell_curve_scalar(
+    company_name: str,
+    assessment_date,
+    mu: float,
+    lower: float,
+    upper: float,
+    evidence_count: Optional[int] = None,
+    conf_level: float = 0.95,
+):
+    """Bell curve for a single result given as scalars (no DataFrame). Returns fig, ax."""
+    # Deferred so reruns that never plot skip matplotlib's import/backend setup. A bare Figure
+    # (not pyplot) keeps concurrent sessions off pyplot's global figure manager.
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=(9, 4))
+    ax = fig.subplots()
+    _draw_bell(
+        ax,
+        mu,
+        lower,
+        upper,
+        evidence_count,
+        conf_level,
+        f"{company_name}  |  {assessment_date}",
+    )
+    fig.tight_layout()
     return fig, ax
 
 
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_bell_png(
+    company_name: str,
+    assessment_date: str,
+    mu: float,
+    lower: float,
+    upper: float,
+    evidence_count: int,
+    conf_level: float,
+) -> bytes:
+    """Bell curve for one result rendered to PNG bytes, reused across identical submits.
+
+    Bytes (not the Figure) are cached so sessions never share a mutable matplotlib object.
+    """
+    import io
+
+    fig, _ = _plot_sem_bell_curve_scalar(
+        company_name, assessment_date, mu, lower, upper, evidence_count, conf_level
+    )
+    buf = io.BytesIO()
+    # Same options st.pyplot uses
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    return buf.getvalue()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_calculators():
+    """(VR, HR, Synergy, Org-AI-R) calculators, built once per server process and shared."""
+    # Deferred so the page loads without scipy/numpy (avoids env issues); an ImportError
+    # is not cached, so it surfaces on each submit until the environment is fixed.
+    from app.scoring.hr_calculator import HRCalculator
+    from app.scoring.org_air_calculator import OrgAIRCalculator
+    from app.scoring.synergy_calculator import SynergyCalculator
+    from app.scoring.vr_calculator import VRCalculator
+
+    return VRCalculator(), HRCalculator(), SynergyCalculator(), OrgAIRCalculator()
+
+
 def _alignment_from_dim_scores(dim_scores: dict[str, float]) -> float:
     """Compute alignment from dimension scores (same as backend)."""
     leadership = dim_scores.get("leadership_vision", 50.0)
     governance = dim_scores.get("ai_governance", 50.0)
-    raw = (0.6 * leadership + 0.4 * governance) / 100.0
-    return max(0.5, min(0.95, raw))
+    raw = 0.006 * leadership + 0.004 * governance  # (0.6 * L + 0.4 * G) / 100
+    return 0.5 if raw < 0.5 else 0.95 if raw > 0.95 else raw
 
 
-def _sector_and_hr_baseline_from_company(company_id: str):
-    """Get sector, hr_baseline, company_name, and industry_name from company + industries APIs."""
-    client = get_client()
-    try:
-        company = get_company(company_id, client=client)
-        company_name = company.get("name", "")
-        industry_id = company.get("industry_id")
-        if not industry_id:
-            return ("financial_services", 60.0, company_name, "")
-        industries = get_industries(client=client)
-        ind = next(
-            (i for i in industries if str(i.get("id")) == str(industry_id)), None
-        )
-        if not ind:
-            return ("financial_services", 60.0, company_name, "")
-        db_sector = (ind.get("sector") or "Services").strip()
-        sector = SECTOR_MAP.get(db_sector, "business_services")
-        industry_name = ind.get("name", db_sector)
-        return (sector, 60.0, company_name, industry_name)
-    except Exception:
-        return ("financial_services", 60.0, "", "")
-    finally:
-        client.close()
+def _company_info_from_bundle(bundle: dict) -> tuple[str, float, str, str]:
+    """(sector, hr_baseline, company_name, industry_name) from the prefill bundle's company/industry."""
+    company_name = bundle.get("company_name") or ""
+    if not bundle.get("industry_id") or bundle.get("industry_name") is None:
+        return ("financial_services", 60.0, company_name, "")
+    db_sector = (bundle.get("industry_sector") or "Services").strip()
+    sector = SECTOR_MAP.get(db_sector, "business_services")
+    return (sector, 60.0, company_name, bundle["industry_name"] or db_sector)
 
 
-def _fetch_prefill_for_company(company_id: str, ticker: str):
-    """Fetch org-air for company and return dict of form defaults. Returns None on error."""
-    if not company_id or not ticker:
-        return None
-    client = get_client()
-    try:
-        data = get_org_air(company_id, client=client)
-    except Exception:
-        return None
-    finally:
-        client.close()
+def _prefill_from_org_air(data: dict) -> dict:
+    """Form defaults from an org-air payload."""
     dim_scores = data.get("dimension_scores") or {}
     dim_str = ", ".join(
-        str(round(float(dim_scores.get(d.value, 50.0)), 2)) for d in DIMENSION_ORDER
+        f"{float(dim_scores.get(dv, 50.0)):.2f}" for dv in DIMENSION_VALUES
     )
     tc = data.get("talent_concentration")
     tc_pct = (float(tc) * 100.0) if tc is not None else 25.0
     sector = (data.get("sector") or "financial_services").strip()
-    sector_index = SECTOR_OPTIONS.index(sector) if sector in SECTOR_OPTIONS else 1
+    sector_index = _SECTOR_INDEX.get(sector, 1)
     return {
-        "company_label": (
-            f"{ticker} ({company_id[:8]}...)"
-            if len(company_id) > 8
-            else f"{ticker} ({company_id})"
-        ),
         "sector": sector,
         "sector_index": sector_index,
         "dim_scores_raw": dim_str or DEFAULT_DIMENSION_SCORES,
@@ -295,21 +316,84 @@ def _fetch_prefill_for_company(company_id: str, ticker: str):
     }
 
 
+@st.cache_data(ttl=120, max_entries=128, show_spinner=False)
+def _prefill_cached(api_url: str, company_id: str):
+    """
+    One GET prefill call, cached 2 min per company (errors propagate, uncached):
+    (form defaults, or None when not scored yet; company info tuple).
+    """
+    bundle = get_prefill_bundle(company_id, client=get_shared_client(api_url))
+    org_air = bundle.get("org_air")
+    prefill = _prefill_from_org_air(org_air) if org_air else None
+    return prefill, _company_info_from_bundle(bundle)
+
+
+def _fetch_prefill_for_company(company_id: str, refetch: bool):
+    """
+    (form defaults or None, (sector, hr_baseline, company_name, industry_name)).
+    Reuses this session's copy for the company unless refetch (company changed or Refresh
+    prefill); static defaults on error, which are not kept so the next run retries.
+    """
+    held = st.session_state.get(_CALC_BUNDLE_KEY)
+    if not refetch and held is not None and held[0] == company_id:
+        return held[1]
+    try:
+        bundle = _prefill_cached(get_api_url(), company_id)
+    except Exception:
+        return None, _NO_COMPANY_INFO
+    st.session_state[_CALC_BUNDLE_KEY] = (company_id, bundle)
+    return bundle
+
+
+def _refresh_prefill() -> None:
+    """Drop cached prefill and re-apply it to the form (e.g. after Run Pipeline)."""
+    _prefill_cached.clear()
+    st.session_state.pop(_CALC_PREFILL_KEY, None)
+
+
 def _parse_dimension_scores(raw: str) -> dict[str, float]:
     """Parse comma-separated floats into dimension name -> score (order = Dimension enum)."""
+    n = len(DIMENSION_VALUES)
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", DeprecationWarning)
+            vals = np.fromstring(raw, dtype=np.float64, sep=",")
+    except ValueError:
+        vals = np.array([])
+    if vals.size == raw.count(",") + 1:
+        # Well-formed input: pad missing dimensions with 50, drop extras, clamp in one pass
+        if vals.size < n:
+            vals = np.concatenate([vals, np.full(n - vals.size, 50.0)])
+        vals = vals[:n]
+        np.clip(vals, 0.0, 100.0, out=vals)
+        return dict(zip(DIMENSION_VALUES, vals.tolist()))
+
+    # Malformed or empty entries: per-element parse keeps valid values in place
     parts = [p.strip() for p in raw.split(",") if p.strip()]
     result = {}
-    for i, dim in enumerate(DIMENSION_ORDER):
+    for i, dv in enumerate(DIMENSION_VALUES):
         if i < len(parts):
             try:
-                result[dim.value] = max(0.0, min(100.0, float(parts[i])))
+                result[dv] = max(0.0, min(100.0, float(parts[i])))
             except ValueError:
-                result[dim.value] = 50.0
+                result[dv] = 50.0
         else:
-            result[dim.value] = 50.0
+            result[dv] = 50.0
     return result
 
 
+def _parsed_dimension_scores(raw: str) -> dict[str, float]:
+    """
+    _parse_dimension_scores memoized in session state on the raw string (page functions are
+    redefined every rerun, so an lru_cache here would never hit). Returns a fresh dict.
+    """
+    memo = st.session_state.get(_DIM_PARSED_KEY)
+    if memo is None or memo[0] != raw:
+        memo = (raw, tuple(_parse_dimension_scores(raw).items()))
+        st.session_state[_DIM_PARSED_KEY] = memo
+    return dict(memo[1])
+
+
 st.set_page_config(
     page_title="Org-AI-R Calculator | PE Org-AI-R",
     page_icon="🧮",
@@ -323,264 +407,282 @@ st.title("Company Org-AI-R Scoring Calculator")
 cid = st.session_state.get(KEY_COMPANY_ID, "")
 ticker = st.session_state.get(KEY_TICKER, "")
 
-# When the selected company changes, clear form widget state so values update from prefill
-_CALC_PREFILL_KEY = "calc_prefill_company_id"
+# When the selected company changes, the form widgets are re-seeded from prefill below
 cleared = False
 if st.session_state.get(_CALC_PREFILL_KEY) != cid:
-    for key in list(st.session_state.keys()):
-        if key.startswith("calc_") and key != _CALC_PREFILL_KEY:
-            del st.session_state[key]
     st.session_state[_CALC_PREFILL_KEY] = cid
     cleared = True
 
-prefill = _fetch_prefill_for_company(cid, ticker) if cid and ticker else None
+# One check for the whole load path: with no selection there is nothing to fetch
+_has_selection = bool(cid) and bool(ticker)
 
-# Sector, HR baseline, company name, and industry name: from company + industries
-if cid and ticker:
-    (
+if _has_selection:
+    # Form defaults plus sector, HR baseline, company name, and industry name in one call
+    prefill, (
         sector_from_company,
         hr_baseline_from_company,
         company_name_from_db,
         industry_name_from_db,
-    ) = _sector_and_hr_baseline_from_company(cid)
+    ) = _fetch_prefill_for_company(cid, refetch=cleared)
+
+    if prefill is None:
+        st.warning(
+            "No scoring data for this company yet. Run **Run Pipeline** for this company, or enter values manually."
+        )
+
+    # Read-only company info panel (upper left, outside the form)
+    info_col1, info_col2 = st.columns(2)
+    with info_col1:
+        st.metric(
+            "Company",
+            f"{ticker} — {company_name_from_db}" if company_name_from_db else ticker,
+        )
+    with info_col2:
+        st.metric("Industry Sector", industry_name_from_db or sector_from_company)
+    st.button(
+        "Refresh prefill",
+        on_click=_refresh_prefill,
+        help="Reload this company's scores into the form (e.g. after Run Pipeline).",
+    )
 else:
+    prefill = None
     (
         sector_from_company,
         hr_baseline_from_company,
         company_name_from_db,
         industry_name_from_db,
-    ) = ("financial_services", 60.0, "", "")
-
-if not (cid and ticker):
+    ) = _NO_COMPANY_INFO
     st.info(
         "Select a company (ticker) in the sidebar to prefill the form with that company's scores."
     )
-elif prefill is None:
-    st.warning(
-        "No scoring data for this company yet. Run **Run Pipeline** for this company, or enter values manually."
-    )
 
-# Read-only company info panel (upper left, outside the form)
-if cid and ticker:
-    info_col1, info_col2 = st.columns(2)
-    with info_col1:
-        display_name = company_name_from_db or ticker
-        st.metric(
-            "Company", f"{ticker} — {display_name}" if company_name_from_db else ticker
-        )
-    with info_col2:
-        st.metric("Industry Sector", industry_name_from_db or sector_from_company)
+# Defaults: from prefill when available, else from company (sector, hr_baseline) or static
+# defaults. Recomputed only when the company or its prefill changes; otherwise this
+# session's copy is reused (the held prefill bundle is the same object across reruns).
+_held_defaults = st.session_state.get(_CALC_DEFAULTS_KEY)
+if (
+    cleared
+    or _held_defaults is None
+    or _held_defaults[0] != cid
+    or _held_defaults[1] is not prefill
+):
+    default_dim_scores = (
+        prefill and prefill.get("dim_scores_raw")
+    ) or DEFAULT_DIMENSION_SCORES
+    calc_defaults = {
+        "dim_dict": _parsed_dimension_scores(default_dim_scores),
+        "tc": (prefill and prefill.get("talent_concentration_pct", 25.0)) or 25.0,
+        "hr_baseline": (
+            (prefill and prefill.get("hr_baseline")) or hr_baseline_from_company
+        ),
+        "pf": (prefill and prefill.get("position_factor", 0.80)) or 0.80,
+        "align": (prefill and prefill.get("alignment", 0.90)) or 0.90,
+        "timing": 1.10,
+        "sector": sector_from_company,
+        "cid": cid,
+        "ticker": ticker,
+        "company_name": company_name_from_db,
+        "evidence": (prefill and prefill.get("evidence_count", 15)) or 15,
+    }
+    st.session_state[_CALC_DEFAULTS_KEY] = (cid, prefill, calc_defaults)
+else:
+    calc_defaults = _held_defaults[2]
 
-# Defaults: from prefill when available, else from company (sector, hr_baseline) or static defaults
-default_sector_value = (prefill and prefill.get("sector")) or sector_from_company
-if default_sector_value not in SECTOR_OPTIONS:
-    default_sector_value = "financial_services"
-
-default_dim_scores = (
-    prefill and prefill.get("dim_scores_raw")
-) or DEFAULT_DIMENSION_SCORES
-default_dim_dict = _parse_dimension_scores(default_dim_scores)
-default_tc = (prefill and prefill.get("talent_concentration_pct", 25.0)) or 25.0
-default_pf = (prefill and prefill.get("position_factor", 0.80)) or 0.80
-default_hr_baseline = (
-    prefill and prefill.get("hr_baseline")
-) or hr_baseline_from_company
-default_align = (prefill and prefill.get("alignment", 0.90)) or 0.90
-default_evidence = (prefill and prefill.get("evidence_count", 15)) or 15
-default_timing = 1.10
-
-# When company changed: force all form widgets to show prefilled values via session state
+# When company changed: force form widgets to show prefilled values via session state,
+# writing only the keys whose value actually differs (one update, no clear-then-reset)
 if cleared:
-    for dim in DIMENSION_ORDER:
-        st.session_state[f"calc_dim_{dim.value}"] = default_dim_dict.get(
-            dim.value, 50.0
+    calc_values = dict(
+        zip(
+            _CALC_KEYS,
+            [calc_defaults["dim_dict"].get(dv, 50.0) for dv in DIMENSION_VALUES]
+            + [
+                calc_defaults[k]
+                for k in ("tc", "hr_baseline", "pf", "align", "timing")
+            ],
         )
-    st.session_state["calc_tc"] = default_tc
-    st.session_state["calc_hr_baseline"] = default_hr_baseline
-    st.session_state["calc_pf"] = default_pf
-    st.session_state["calc_align"] = default_align
-    st.session_state["calc_timing"] = default_timing
-
-with st.form("org_air_calculator_form", clear_on_submit=False):
-    st.subheader("V^R (Idiosyncratic Readiness) Factors")
-    st.caption("Dimension Scores (0–100)")
-    dim_cols_a = st.columns(4)
-    dim_cols_b = st.columns(3)
-    for i, dim in enumerate(DIMENSION_ORDER):
-        col = dim_cols_a[i] if i < 4 else dim_cols_b[i - 4]
-        with col:
-            st.number_input(
-                dim.value.replace("_", " ").title(),
-                min_value=0.0,
-                max_value=100.0,
-                value=float(default_dim_dict.get(dim.value, 50.0)),
-                step=1.0,
-                format="%.1f",
-                key=f"calc_dim_{dim.value}",
-            )
-    talent_concentration_pct = st.number_input(
-        "Talent Concentration (%)",
-        min_value=0.0,
-        max_value=100.0,
-        value=default_tc,
-        step=1.0,
-        format="%.2f",
-        help="Stored as ratio 0–1 for V^R (e.g. 25 → 0.25).",
-        key="calc_tc",
     )
+    st.session_state.update(
+        {k: v for k, v in calc_values.items() if st.session_state.get(k) != v}
+    )
+
 
-    st.subheader("H^R (Systematic Opportunity) Factors")
-    hr_col1, hr_col2 = st.columns(2)
-    with hr_col1:
-        hr_baseline = st.number_input(
-            "HR Baseline Score (0–100)",
+@_fragment
+def _render_calculator(d: dict) -> None:
+    """
+    Form + result. A fragment, so Calculate reruns only this block; the prefill
+    above runs on full reruns (company change, Refresh prefill) only.
+    """
+    default_dim_dict = d["dim_dict"]
+    sector_from_company = d["sector"]
+    cid, ticker = d["cid"], d["ticker"]
+    company_name_from_db = d["company_name"]
+    default_evidence = d["evidence"]
+
+    with st.form("org_air_calculator_form", clear_on_submit=False):
+        st.subheader("V^R (Idiosyncratic Readiness) Factors")
+        st.caption("Dimension Scores (0–100)")
+        dim_cols_a = st.columns(4)
+        dim_cols_b = st.columns(3)
+        dim_inputs = []
+        for i, (dv, label) in enumerate(zip(DIMENSION_VALUES, DIMENSION_TITLES)):
+            col = dim_cols_a[i] if i < 4 else dim_cols_b[i - 4]
+            with col:
+                dim_input = st.number_input(
+                    label,
+                    min_value=0.0,
+                    max_value=100.0,
+                    value=float(default_dim_dict.get(dv, 50.0)),
+                    step=1.0,
+                    format="%.1f",
+                    key=f"calc_dim_{dv}",
+                )
+                dim_inputs.append(dim_input)
+        talent_concentration_pct = st.number_input(
+            "Talent Concentration (%)",
             min_value=0.0,
             max_value=100.0,
-            value=default_hr_baseline,
+            value=d["tc"],
             step=1.0,
             format="%.2f",
-            help="Industry baseline; overrides sector default when set.",
-            key="calc_hr_baseline",
-        )
-    with hr_col2:
-        position_factor = st.number_input(
-            "Position Factor (e.g. −1 to 1)",
-            min_value=-1.0,
-            max_value=1.0,
-            value=default_pf,
-            step=0.05,
-            format="%.2f",
-            help="−1 = laggard, 0 = average, 1 = leader. Used in H^R formula.",
-            key="calc_pf",
+            help="Stored as ratio 0–1 for V^R (e.g. 25 → 0.25).",
+            key="calc_tc",
         )
 
-    st.subheader("Synergy Factors")
-    syn_col1, syn_col2 = st.columns(2)
-    with syn_col1:
-        alignment = st.number_input(
-            "Alignment Factor (default 0.8)",
-            min_value=0.01,
-            max_value=1.0,
-            value=default_align,
-            step=0.05,
-            format="%.2f",
-            key="calc_align",
-        )
-    with syn_col2:
-        timing_factor = st.number_input(
-            "Timing Factor (default 1.0, clamped [0.8, 1.2])",
-            min_value=0.8,
-            max_value=1.2,
-            value=1.10,
-            step=0.05,
-            format="%.2f",
-            key="calc_timing",
-        )
+        st.subheader("H^R (Systematic Opportunity) Factors")
+        hr_col1, hr_col2 = st.columns(2)
+        with hr_col1:
+            hr_baseline = st.number_input(
+                "HR Baseline Score (0–100)",
+                min_value=0.0,
+                max_value=100.0,
+                value=d["hr_baseline"],
+                step=1.0,
+                format="%.2f",
+                help="Industry baseline; overrides sector default when set.",
+                key="calc_hr_baseline",
+            )
+        with hr_col2:
+            position_factor = st.number_input(
+                "Position Factor (e.g. −1 to 1)",
+                min_value=-1.0,
+                max_value=1.0,
+                value=d["pf"],
+                step=0.05,
+                format="%.2f",
+                help="−1 = laggard, 0 = average, 1 = leader. Used in H^R formula.",
+                key="calc_pf",
+            )
 
-    submitted = st.form_submit_button("Calculate Org-AI-R Score")
+        st.subheader("Synergy Factors")
+        syn_col1, syn_col2 = st.columns(2)
+        with syn_col1:
+            alignment = st.number_input(
+                "Alignment Factor (default 0.8)",
+                min_value=0.01,
+                max_value=1.0,
+                value=d["align"],
+                step=0.05,
+                format="%.2f",
+                key="calc_align",
+            )
+        with syn_col2:
+            timing_factor = st.number_input(
+                "Timing Factor (default 1.0, clamped [0.8, 1.2])",
+                min_value=0.8,
+                max_value=1.2,
+                value=d["timing"],
+                step=0.05,
+                format="%.2f",
+                key="calc_timing",
+            )
 
-if submitted:
-    try:
-        # Defer scoring imports so page loads without scipy/numpy (avoids env issues)
-        from app.scoring.hr_calculator import HRCalculator
-        from app.scoring.org_air_calculator import OrgAIRCalculator
-        from app.scoring.synergy_calculator import SynergyCalculator
-        from app.scoring.vr_calculator import VRCalculator
-
-        dimension_scores = {
-            dim.value: float(st.session_state.get(f"calc_dim_{dim.value}", 50.0))
-            for dim in DIMENSION_ORDER
-        }
-        talent_concentration_pct = st.session_state.get("calc_tc", 25.0)
-        talent_concentration = talent_concentration_pct / 100.0
-
-        vr_calc = VRCalculator()
-        vr_result = vr_calc.calculate(dimension_scores, talent_concentration)
-
-        sector = sector_from_company
-        hr_baseline = st.session_state.get("calc_hr_baseline", 60.0)
-        position_factor = st.session_state.get("calc_pf", 0.80)
-        hr_calc = HRCalculator()
-        hr_result = hr_calc.calculate(
-            sector,
-            position_factor,
-            baseline_override=hr_baseline if hr_baseline else None,
-        )
+        submitted = st.form_submit_button("Calculate Org-AI-R Score")
 
-        alignment = st.session_state.get("calc_align", 0.9)
-        timing_factor = st.session_state.get("calc_timing", 1.1)
-        syn_calc = SynergyCalculator()
-        syn_result = syn_calc.calculate(
-            vr_result.vr_score,
-            hr_result.hr_score,
-            alignment,
-            timing_factor,
-        )
+    if submitted:
+        try:
+            vr_calc, hr_calc, syn_calc, org_calc = _get_calculators()
 
-        company_id = cid or "ACME_CORP"
-        evidence_count = default_evidence
-        confidence_level = 0.95
-        org_calc = OrgAIRCalculator()
-        org_result = org_calc.calculate(
-            company_id=company_id or "ACME_CORP",
-            sector=sector,
-            vr_result=vr_result,
-            hr_result=hr_result,
-            synergy_result=syn_result,
-            evidence_count=int(evidence_count),
-            confidence_level=float(confidence_level),
-        )
+            # Widget return values above are the submitted values (no session_state reads)
+            dimension_scores = dict(zip(DIMENSION_VALUES, map(float, dim_inputs)))
+            talent_concentration = talent_concentration_pct / 100.0
 
-        st.success("Org-AI-R score calculated.")
+            vr_result = vr_calc.calculate(dimension_scores, talent_concentration)
 
-        # Prominent Org-AI-R score
-        org_score = round(float(org_result.final_score), 2)
-        st.subheader(f"Org-AI-R Score")
-        st.markdown(
-            f"<h1 style='margin-top:0'>{org_score}</h1>", unsafe_allow_html=True
-        )
+            sector = sector_from_company
+            hr_result = hr_calc.calculate(
+                sector,
+                position_factor,
+                baseline_override=hr_baseline if hr_baseline else None,
+            )
 
-        # Supporting factors on next line
-        f1, f2, f3 = st.columns(3)
-        f1.metric(
-            "V^R (Idiosyncratic Readiness)",
-            round(float(org_result.vr_result.vr_score), 2),
-        )
-        f2.metric(
-            "H^R (Systematic Opportunity)",
-            round(float(org_result.hr_result.hr_score), 2),
-        )
-        f3.metric("Synergy", round(float(org_result.synergy_result.synergy_score), 2))
-
-        # SEM bell-curve graph
-        st.subheader("SEM Confidence Interval")
-        _display_name = company_name_from_db or ticker or "Company"
-        _bell_df = pd.DataFrame(
-            [
-                {
-                    "COMPANY_NAME": _display_name,
-                    "ASSESSMENT_DATE": pd.Timestamp.today().normalize(),
-                    "V_R_SCORE": float(org_result.final_score),
-                    "CONFIDENCE_LOWER": float(org_result.confidence_interval.ci_lower),
-                    "CONFIDENCE_UPPER": float(org_result.confidence_interval.ci_upper),
-                    "EVIDENCE_COUNT": int(
-                        org_result.confidence_interval.evidence_count
-                    ),
-                }
-            ]
-        )
-        try:
-            _fig, _ = _plot_sem_bell_curve(_bell_df, _display_name, conf_level=0.95)
-            st.pyplot(_fig)
-            plt.close(_fig)
-        except ValueError as _bell_err:
-            st.warning(f"Bell curve could not be rendered: {_bell_err}")
-    except ImportError as e:
-        st.error(
-            "Scoring engine could not be loaded (numpy/scipy). "
-            "Try: `poetry run pip install --upgrade numpy scipy` or use Python 3.11/3.12."
-        )
-        st.exception(e)
-    except Exception as e:
-        st.error(f"Calculation failed: {e}")
-        st.exception(e)
+            syn_result = syn_calc.calculate(
+                vr_result.vr_score,
+                hr_result.hr_score,
+                alignment,
+                timing_factor,
+            )
+
+            company_id = cid or "ACME_CORP"
+            evidence_count = default_evidence
+            confidence_level = 0.95
+            org_result = org_calc.calculate(
+                company_id=company_id or "ACME_CORP",
+                sector=sector,
+                vr_result=vr_result,
+                hr_result=hr_result,
+                synergy_result=syn_result,
+                evidence_count=int(evidence_count),
+                confidence_level=float(confidence_level),
+            )
+
+            st.success("Org-AI-R score calculated.")
+
+            # Prominent Org-AI-R score
+            org_score = round(float(org_result.final_score), 2)
+            st.subheader(f"Org-AI-R Score")
+            st.markdown(
+                f"<h1 style='margin-top:0'>{org_score}</h1>", unsafe_allow_html=True
+            )
+
+            # Supporting factors on next line
+            f1, f2, f3 = st.columns(3)
+            f1.metric(
+                "V^R (Idiosyncratic Readiness)",
+                round(float(org_result.vr_result.vr_score), 2),
+            )
+            f2.metric(
+                "H^R (Systematic Opportunity)",
+                round(float(org_result.hr_result.hr_score), 2),
+            )
+            f3.metric(
+                "Synergy", round(float(org_result.synergy_result.synergy_score), 2)
+            )
+
+            # SEM bell-curve graph
+            st.subheader("SEM Confidence Interval")
+            _display_name = company_name_from_db or ticker or "Company"
+            try:
+                _png = _cached_bell_png(
+                    _display_name,
+                    pd.Timestamp.today().date().isoformat(),
+                    float(org_result.final_score),
+                    float(org_result.confidence_interval.ci_lower),
+                    float(org_result.confidence_interval.ci_upper),
+                    int(org_result.confidence_interval.evidence_count),
+                    0.95,
+                )
+                st.image(_png)
+            except ValueError as _bell_err:
+                st.warning(f"Bell curve could not be rendered: {_bell_err}")
+        except ImportError as e:
+            st.error(
+                "Scoring engine could not be loaded (numpy/scipy). "
+                "Try: `poetry run pip install --upgrade numpy scipy` or use Python 3.11/3.12."
+            )
+            st.exception(e)
+        except Exception as e:
+            st.error(f"Calculation failed: {e}")
+            st.exception(e)
+
+
+_render_calculator(calc_defaults)
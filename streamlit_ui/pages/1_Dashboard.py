@@ -1,7 +1,7 @@
 """Dashboard: evidence stats and target companies."""
 import streamlit as st
 
-from streamlit_ui.components.api_client import get_client, get_evidence_stats, get_target_companies
+from streamlit_ui.components.api_client import get_evidence_stats, get_shared_client, get_target_companies
 from streamlit_ui.components.json_viewer import render_json
 from streamlit_ui.utils.config import get_api_url
 
@@ -10,8 +10,17 @@ st.set_page_config(page_title="Dashboard | PE Org-AI-R", page_icon="📊", layou
 st.title("Dashboard")
 st.caption("Evidence collection statistics and target companies")
 
+
+def _refresh() -> None:
+    """Drop cached stats/companies so the next run re-fetches them."""
+    get_evidence_stats.clear()
+    get_target_companies.clear()
+
+
+st.button("Refresh", on_click=_refresh, help="Stats are cached 30s and target companies 5 min.")
+
 api_url = get_api_url()
-client = get_client()
+client = get_shared_client(api_url)
 
 try:
     stats = get_evidence_stats(client)
@@ -63,5 +72,3 @@ else:
 # Raw JSON
 render_json(stats, "View stats JSON", expanded=False)
 render_json(companies_data, "View target companies JSON", expanded=False)
-
-client.close()
@@ -3,30 +3,79 @@
 import streamlit as st
 
 from streamlit_ui.components.api_client import (
-    get_client,
-    get_companies,
+    get_shared_client,
+    get_ticker_index,
     collect_documents,
     collect_documents_all,
     get_document_collection_logs,
 )
 from streamlit_ui.utils.config import get_api_url
 
+def _company_options(api_url: str) -> tuple[list[str], list[str]]:
+    """(labels, ids) for the company selectbox, from the ticker index (all pages; cached 2 min per API URL)."""
+    ticker_to_id, tickers, ticker_labels = get_ticker_index(api_url.rstrip("/"))
+    return [ticker_labels[t] for t in tickers[1:]], [ticker_to_id[t] for t in tickers[1:]]
+
+
+@st.cache_data(ttl=2, max_entries=32, show_spinner=False)
+def _cached_logs(api_url: str, task_id: str, since: int) -> dict:
+    """Log lines after `since` for a task, cached 2s so unrelated widget reruns skip the call."""
+    return get_document_collection_logs(task_id, client=get_shared_client(api_url), since=since)
+
+
+# Rerun only the log panel on Refresh (st.fragment; experimental_ before 1.37)
+_fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda fn: fn)
+)
+
+
+@_fragment
+def _documents_log_panel(api_url: str, task_id: str) -> None:
+    """Pipeline log for task_id; Refresh log re-runs just this panel, not the whole page."""
+    st.markdown("**Pipeline log**")
+    if st.button("Refresh log", key="documents_refresh_log"):
+        _cached_logs.clear()
+    # Keep lines already fetched for this task and ask the server only for lines after the cursor
+    log_state = st.session_state.get("documents_task_log")
+    if not log_state or log_state["task_id"] != task_id:
+        log_state = {"task_id": task_id, "lines": [], "cursor": 0, "finished": False}
+        st.session_state["documents_task_log"] = log_state
+    try:
+        if not log_state["finished"]:
+            data = _cached_logs(api_url, task_id, log_state["cursor"])
+            log_state["lines"].extend(data.get("logs") or [])
+            log_state["cursor"] = data.get("next_cursor", log_state["cursor"])
+            log_state["finished"] = data.get("finished", False)
+        logs = log_state["lines"]
+        finished = log_state["finished"]
+    except Exception:
+        logs = ["(Could not fetch logs from server.)"]
+        finished = False
+    status = " (finished)" if finished else " (running)"
+    st.caption(f"Task status:{status} Click Refresh log to update.")
+    log_text = "\n".join(logs) if logs else "(waiting for logs…)"
+    st.text_area(
+        "Log output",
+        value=log_text,
+        height=220,
+        disabled=True,
+        label_visibility="collapsed",
+        key="documents_pipeline_log_output",
+    )
+
+
 st.set_page_config(page_title="Documents | PE Org-AI-R", page_icon="📄", layout="wide")
 st.title("Documents")
 st.caption("Run the documents pipeline for a company and view server logs below.")
 
 api_url = get_api_url()
-client = get_client()
+client = get_shared_client(api_url)
 
 # --- Run documents pipeline ---
 st.subheader("Run documents pipeline")
-companies_data = get_companies(client)
-companies_items = companies_data.get("items") or []
-company_options = [
-    (f"{c.get('ticker', '')} — {c.get('name', '')}", str(c["id"]))
-    for c in companies_items
-    if c.get("id") and c.get("ticker")
-]
+company_labels, company_ids = _company_options(api_url)
 FILING_TYPES = ["10-K", "10-Q", "8-K", "DEF-14A"]
 
 run_scope = st.radio(
@@ -36,14 +85,12 @@ run_scope = st.radio(
     key="doc_run_scope",
     horizontal=True,
 )
-if not company_options and run_scope == "One company":
+if not company_ids and run_scope == "One company":
     st.caption("Add at least one company (Companies page) to run the pipeline.")
-elif run_scope == "All companies" and not company_options:
+elif run_scope == "All companies" and not company_ids:
     st.caption("Add at least one company (Companies page) to run the pipeline for all.")
 else:
     with st.form("run_documents_pipeline"):
-        company_labels = [x[0] for x in company_options]
-        company_ids = [x[1] for x in company_options]
         sel_idx = st.selectbox(
             "Company",
             range(len(company_labels)),
@@ -99,26 +146,4 @@ else:
     # Pipeline log: fetch on load or when Refresh is clicked (no auto-polling)
     task_id = st.session_state.get("documents_task_id")
     if task_id:
-        st.markdown("**Pipeline log**")
-        if st.button("Refresh log", key="documents_refresh_log"):
-            st.rerun()
-        try:
-            data = get_document_collection_logs(task_id, client=client)
-            logs = data.get("logs") or []
-            finished = data.get("finished", False)
-        except Exception:
-            logs = ["(Could not fetch logs from server.)"]
-            finished = False
-        status = " (finished)" if finished else " (running)"
-        st.caption(f"Task status:{status} Click Refresh log to update.")
-        log_text = "\n".join(logs) if logs else "(waiting for logs…)"
-        st.text_area(
-            "Log output",
-            value=log_text,
-            height=220,
-            disabled=True,
-            label_visibility="collapsed",
-            key="documents_pipeline_log_output",
-        )
-
-client.close()
+        _documents_log_panel(api_url, task_id)
@@ -1,11 +1,12 @@
 """Signals: run external signal pipeline for a company, then view signals table."""
+from concurrent.futures import ThreadPoolExecutor
 from uuid import UUID
 
+import pandas as pd
 import streamlit as st
 
 from streamlit_ui.components.api_client import (
-    get_client,
-    get_companies,
+    get_shared_client,
     get_signals,
     collect_signals,
     collect_signals_all,
@@ -13,26 +14,235 @@ from streamlit_ui.components.api_client import (
     get_signal_formulas,
     compute_signals,
     get_company_signal_summary,
+    get_ticker_index,
     put_raw_glassdoor_reviews,
 )
 from streamlit_ui.utils.config import get_api_url
 
+# Rerun only the log panel or results section on Refresh (st.fragment; experimental_ before 1.37)
+_fragment = (
+    getattr(st, "fragment", None)
+    or getattr(st, "experimental_fragment", None)
+    or (lambda fn: fn)
+)
+
+
+@_fragment
+def _signals_log_panel(task_id: str) -> None:
+    """Pipeline log for task_id; Refresh log re-runs just this panel, not the whole page."""
+    st.markdown("**Pipeline log**")
+    st.button("Refresh log", key="signals_refresh_log")
+    # Keep lines already fetched for this task and ask the server only for lines after the cursor
+    log_state = st.session_state.get("signals_task_log")
+    if not log_state or log_state["task_id"] != task_id:
+        log_state = {"task_id": task_id, "lines": [], "cursor": 0, "finished": False}
+        st.session_state["signals_task_log"] = log_state
+    try:
+        if not log_state["finished"]:
+            data = get_signal_collection_logs(
+                task_id, client=get_shared_client(get_api_url()), since=log_state["cursor"]
+            )
+            log_state["lines"].extend(data.get("logs") or [])
+            log_state["cursor"] = data.get("next_cursor", log_state["cursor"])
+            log_state["finished"] = data.get("finished", False)
+        logs = log_state["lines"]
+    except Exception:
+        logs = ["(Could not fetch logs from server.)"]
+    st.caption("Click Refresh log to update. No automatic polling.")
+    log_text = "\n".join(logs) if logs else "(waiting for logs…)"
+    st.text_area(
+        "Signal pipeline log",
+        value=log_text,
+        height=200,
+        disabled=True,
+        label_visibility="collapsed",
+        key="signals_pipeline_log_output",
+    )
+
+
+# (checkbox key suffix, category, label, checked by default) for the collect/compute forms
+SIGNAL_CATEGORY_CHOICES = (
+    ("tech", "technology_hiring", "Technology hiring", True),
+    ("innovation", "innovation_activity", "Innovation activity", True),
+    ("digital", "digital_presence", "Digital presence", True),
+    ("leadership", "leadership_signals", "Leadership signals", True),
+    ("glassdoor", "glassdoor_reviews", "Glassdoor reviews", False),
+    ("board", "board_composition", "Board composition", False),
+)
+
+
+def _category_checkboxes(key_prefix: str) -> list[str]:
+    """One checkbox per signal category (keys '<key_prefix>_<suffix>'); returns the checked categories."""
+    return [
+        category
+        for suffix, category, label, default in SIGNAL_CATEGORY_CHOICES
+        if st.checkbox(label, value=default, key=f"{key_prefix}_{suffix}")
+    ]
+
+
+# Display order and labels for the per-category computation view
+CATEGORY_ORDER = [
+    "technology_hiring",
+    "innovation_activity",
+    "digital_presence",
+    "leadership_signals",
+    "glassdoor_reviews",
+    "board_composition",
+]
+CATEGORY_LABELS = {
+    "technology_hiring": "Technology hiring (job)",
+    "innovation_activity": "Innovation activity",
+    "digital_presence": "Digital presence",
+    "leadership_signals": "Leadership signals",
+    "glassdoor_reviews": "Glassdoor reviews",
+    "board_composition": "Board composition",
+}
+# (summary field, metric label); the composite is their plain average
+SUMMARY_SCORES = (
+    ("technology_hiring_score", "Technology hiring"),
+    ("innovation_activity_score", "Innovation activity"),
+    ("digital_presence_score", "Digital presence"),
+    ("leadership_signals_score", "Leadership signals"),
+)
+
+
+@_fragment
+def _signals_results(company_id: str, company_label: str, formulas: dict[str, str]) -> None:
+    """Signals table, per-category computation and final summary; Refresh table re-runs just this."""
+    st.subheader(f"Signals for {company_label}")
+    # The summary is cached for 15s; Refresh must refetch it along with the signals
+    st.button("Refresh table", key="signals_refresh_table", on_click=get_company_signal_summary.clear)
+    # Signals and the final summary are independent reads: fetch the signals in a worker while the
+    # (st.cache_data-backed) summary is read on the script thread
+    company_uuid = UUID(company_id)
+    client = get_shared_client(get_api_url())
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        signals_fut = pool.submit(
+            get_signals, client=client, page=1, page_size=100, company_id=company_uuid
+        )
+        try:
+            summary = get_company_signal_summary(company_uuid, client=client)
+        except Exception:
+            summary = None
+    try:
+        result = signals_fut.result()
+    except Exception as e:
+        st.error(f"Cannot load signals: {e}")
+    else:
+        items = result.get("items") or []
+        total = result.get("total", 0)
+        if not items:
+            st.info("No signals yet for this company. Run the pipeline, then click Refresh table.")
+        else:
+            st.caption(f"Total: {total} signals.")
+            # Project the needed columns in one DataFrame build, then trim text column-wise
+            signals_df = pd.DataFrame(
+                items, columns=["id", "category", "source", "raw_value", "normalized_score", "confidence"]
+            ).rename(columns={"normalized_score": "score"})
+            signals_df["id"] = signals_df["id"].astype(str).str.slice(0, 8)
+            signals_df["raw_value"] = signals_df["raw_value"].fillna("").astype(str).str.slice(0, 80)
+            st.dataframe(signals_df, use_container_width=True, hide_index=True)
+
+            # --- Signal computation by category ---
+            st.subheader("Signal computation by category")
+            st.caption("Expand a category to see how its score was calculated.")
+            # Only the first signal per category is shown, so keep just that one
+            first_by_cat = {}
+            for s in items:
+                first_by_cat.setdefault(s.get("category") or "", s)
+            for cat in CATEGORY_ORDER:
+                rep = first_by_cat.get(cat)
+                if rep is None:
+                    continue
+                label = CATEGORY_LABELS.get(cat, cat.replace("_", " ").title())
+                formula_text = formulas.get(cat, "(No formula description.)")
+                with st.expander(label, expanded=False):
+                    st.markdown("**Formula**")
+                    st.markdown(formula_text)
+                    st.markdown("**Computation for this company**")
+                    st.write("Score:", rep.get("normalized_score"), "| Confidence:", rep.get("confidence"))
+                    raw_val = rep.get("raw_value") or ""
+                    if raw_val:
+                        st.write("Raw value:", raw_val[:200] + ("..." if len(raw_val) > 200 else ""))
+                    meta = rep.get("metadata")
+                    if meta and isinstance(meta, dict):
+                        st.markdown("**Metadata**")
+                        st.json(meta)
+                    elif meta:
+                        st.markdown("**Metadata**")
+                        st.write(meta)
+
+    # --- Final summary ---
+    st.subheader("Final summary")
+    if summary:
+        scores = [float(summary.get(key) or 0) for key, _ in SUMMARY_SCORES]
+        composite = sum(scores) / len(scores)
+        count = int(summary.get("signal_count") or 0)
+        st.metric("Composite score", f"{composite:.1f}")
+        for col, (_, label), score in zip(st.columns(len(SUMMARY_SCORES)), SUMMARY_SCORES, scores):
+            col.metric(label, f"{score:.1f}")
+        st.caption(f"Signal count: {count}")
+    else:
+        st.caption("No summary yet. Run pipeline and Compute to see scores.")
+
+
+@st.cache_resource
+def _compute_pool() -> ThreadPoolExecutor:
+    """Worker pool for compute requests (one per server process)."""
+    return ThreadPoolExecutor(max_workers=4)
+
+
+def _start_compute(company_id: str, company_label: str, categories: list[str]) -> None:
+    """Submit compute_signals in the background; the page shows its status on the next rerun."""
+    fut = _compute_pool().submit(
+        compute_signals, company_id, categories, client=get_shared_client(get_api_url())
+    )
+    st.session_state["signals_compute_job"] = (fut, company_id, company_label, categories)
+
+
+def _render_compute_job() -> None:
+    """Report the background compute started by _start_compute, consuming it once finished."""
+    job = st.session_state.get("signals_compute_job")
+    if not job:
+        return
+    fut, company_id, company_label, categories = job
+    if not fut.done():
+        st.info(f"Computing scores for **{company_label}**… Click Check status to update.")
+        st.button("Check status", key="signals_compute_check")
+        return
+    del st.session_state["signals_compute_job"]
+    try:
+        resp = fut.result()
+    except Exception as e:
+        st.error(f"Compute failed: {e}")
+        return
+    computed = resp.get("computed") or []
+    msg = resp.get("message", "")
+    if computed:
+        get_company_signal_summary.clear()
+        st.success(f"Computed: {', '.join(computed)}. {msg}")
+        st.session_state["signals_last_company_id"] = company_id
+        st.session_state["signals_last_company_label"] = company_label
+        st.session_state["signals_last_categories"] = categories
+    else:
+        st.info(msg or "No raw data found for selected categories.")
+
+
 st.set_page_config(page_title="Signals | PE Org-AI-R", page_icon="📡", layout="wide")
 st.title("Signals")
 st.caption("Run the external signal pipeline for a company, then view the signals table.")
 
 api_url = get_api_url()
-client = get_client()
+client = get_shared_client(api_url)
+_render_compute_job()
 
 # --- Run signals pipeline ---
 st.subheader("Run signals pipeline")
-companies_data = get_companies(client)
-companies_items = companies_data.get("items") or []
-company_options = [
-    (f"{c.get('ticker', '')} — {c.get('name', '')}", str(c["id"]))
-    for c in companies_items
-    if c.get("id") and c.get("ticker")
-]
+# Cached per API URL (all pages of companies), so reruns don't refetch the list
+ticker_to_id, _tickers, _ticker_labels = get_ticker_index(api_url.rstrip("/"))
+# Parallel label/id lists shared by every company selectbox below ('' placeholder dropped)
+company_labels = [_ticker_labels[t] for t in _tickers[1:]]
+company_ids = [ticker_to_id[t] for t in _tickers[1:]]
 
 run_scope = st.radio(
     "Run for",
@@ -41,14 +251,12 @@ run_scope = st.radio(
     key="signals_run_scope",
     horizontal=True,
 )
-if not company_options and run_scope == "One company":
+if not company_ids and run_scope == "One company":
     st.caption("Add at least one company (Companies page) to run the pipeline.")
-elif run_scope == "All companies" and not company_options:
+elif run_scope == "All companies" and not company_ids:
     st.caption("Add at least one company (Companies page) to run the pipeline for all.")
 else:
     with st.form("run_signals_pipeline"):
-        company_labels = [x[0] for x in company_options]
-        company_ids = [x[1] for x in company_options]
         if run_scope == "One company":
             sel_idx = st.selectbox(
                 "Company",
@@ -57,28 +265,10 @@ else:
                 key="signals_company_select",
             )
         st.caption("Select which signal categories to collect:")
-        cat_tech = st.checkbox("Technology hiring", value=True, key="sig_tech")
-        cat_innovation = st.checkbox("Innovation activity", value=True, key="sig_innovation")
-        cat_digital = st.checkbox("Digital presence", value=True, key="sig_digital")
-        cat_leadership = st.checkbox("Leadership signals", value=True, key="sig_leadership")
-        cat_glassdoor = st.checkbox("Glassdoor reviews", value=False, key="sig_glassdoor")
-        cat_board = st.checkbox("Board composition", value=False, key="sig_board")
+        selected_categories = _category_checkboxes("sig")
         run_clicked = st.form_submit_button("Run signals pipeline")
 
     if run_clicked:
-        selected_categories = []
-        if cat_tech:
-            selected_categories.append("technology_hiring")
-        if cat_innovation:
-            selected_categories.append("innovation_activity")
-        if cat_digital:
-            selected_categories.append("digital_presence")
-        if cat_leadership:
-            selected_categories.append("leadership_signals")
-        if cat_glassdoor:
-            selected_categories.append("glassdoor_reviews")
-        if cat_board:
-            selected_categories.append("board_composition")
         if not selected_categories:
             st.error("Select at least one signal category.")
         else:
@@ -107,97 +297,42 @@ else:
     # --- Pipeline log: fetch on Refresh only (no auto-polling) ---
     signals_task_id = st.session_state.get("signals_task_id")
     if signals_task_id:
-        st.markdown("**Pipeline log**")
-        if st.button("Refresh log", key="signals_refresh_log"):
-            st.rerun()
-        try:
-            data = get_signal_collection_logs(signals_task_id, client=client)
-            logs = data.get("logs") or []
-            finished = data.get("finished", False)
-        except Exception:
-            logs = ["(Could not fetch logs from server.)"]
-            finished = False
-        st.caption("Click Refresh log to update. No automatic polling.")
-        log_text = "\n".join(logs) if logs else "(waiting for logs…)"
-        st.text_area(
-            "Signal pipeline log",
-            value=log_text,
-            height=200,
-            disabled=True,
-            label_visibility="collapsed",
-            key="signals_pipeline_log_output",
-        )
+        _signals_log_panel(signals_task_id)
     if signals_task_id and st.session_state.get("signals_last_company_label") == "All companies":
         st.caption("Collection was run for all companies. Run for a single company above to compute scores and view signals for that company.")
 
 # --- Compute from existing data (no fetch) ---
 st.subheader("Compute from existing data")
 st.caption("Run compute on stored raw data only. No API fetch. Pick a company and categories that already have raw data in the DB.")
-if company_options:
-    company_labels_co = [x[0] for x in company_options]
-    company_ids_co = [x[1] for x in company_options]
+if company_ids:
     with st.form("compute_from_existing"):
         co_sel_idx = st.selectbox(
             "Company",
-            range(len(company_labels_co)),
-            format_func=lambda i: company_labels_co[i],
+            range(len(company_labels)),
+            format_func=lambda i: company_labels[i],
             key="compute_only_company",
         )
         st.caption("Select which signal categories to compute (uses stored raw data):")
-        co_tech = st.checkbox("Technology hiring", value=True, key="co_tech")
-        co_innovation = st.checkbox("Innovation activity", value=True, key="co_innovation")
-        co_digital = st.checkbox("Digital presence", value=True, key="co_digital")
-        co_leadership = st.checkbox("Leadership signals", value=True, key="co_leadership")
-        co_glassdoor = st.checkbox("Glassdoor reviews", value=False, key="co_glassdoor")
-        co_board = st.checkbox("Board composition", value=False, key="co_board")
+        co_categories = _category_checkboxes("co")
         co_clicked = st.form_submit_button("Compute from stored raw data")
     if co_clicked:
-        co_categories = []
-        if co_tech:
-            co_categories.append("technology_hiring")
-        if co_innovation:
-            co_categories.append("innovation_activity")
-        if co_digital:
-            co_categories.append("digital_presence")
-        if co_leadership:
-            co_categories.append("leadership_signals")
-        if co_glassdoor:
-            co_categories.append("glassdoor_reviews")
-        if co_board:
-            co_categories.append("board_composition")
         if not co_categories:
             st.error("Select at least one signal category.")
         else:
-            try:
-                co_company_id = company_ids_co[co_sel_idx]
-                co_company_label = company_labels_co[co_sel_idx]
-                resp = compute_signals(co_company_id, co_categories, client=client)
-                computed = resp.get("computed") or []
-                msg = resp.get("message", "")
-                if computed:
-                    st.success(f"Computed: {', '.join(computed)}. {msg}")
-                    st.session_state["signals_last_company_id"] = co_company_id
-                    st.session_state["signals_last_company_label"] = co_company_label
-                    st.session_state["signals_last_categories"] = co_categories
-                else:
-                    st.info(msg or "No raw data found for selected categories.")
-                st.rerun()
-            except Exception as e:
-                st.error(f"Compute failed: {e}")
+            _start_compute(company_ids[co_sel_idx], company_labels[co_sel_idx], co_categories)
+            st.rerun()
 else:
     st.caption("Add at least one company (Companies page) to use compute from existing data.")
 
 # --- Import Glassdoor reviews (JSON) ---
 st.subheader("Import Glassdoor reviews (JSON)")
 st.caption("Store pre-fetched Glassdoor review JSON for a company. Use a file (e.g. data/NVDA.json) or paste JSON. Then run Compute for glassdoor_reviews above.")
-if company_options:
+if company_ids:
     import json as _json
-    imp_labels = [x[0] for x in company_options]
-    imp_ids = [x[1] for x in company_options]
     imp_sel_idx = st.selectbox(
         "Company",
-        range(len(imp_labels)),
-        format_func=lambda i: imp_labels[i],
+        range(len(company_labels)),
+        format_func=lambda i: company_labels[i],
         key="import_glassdoor_company",
     )
     file_upload = st.file_uploader("Upload JSON file", type=["json"], key="import_glassdoor_file")
@@ -221,8 +356,8 @@ if company_options:
                 st.error(f"Invalid JSON: {e}")
         if payload is not None:
             try:
-                company_id = imp_ids[imp_sel_idx]
-                company_label = imp_labels[imp_sel_idx]
+                company_id = company_ids[imp_sel_idx]
+                company_label = company_labels[imp_sel_idx]
                 result = put_raw_glassdoor_reviews(company_id, payload)
                 st.success(f"Stored {result.get('stored', 0)} reviews for {company_label}. {result.get('message', '')}")
             except Exception as e:
@@ -238,9 +373,9 @@ last_categories = st.session_state.get("signals_last_categories") or ["technolog
 if last_company_id and last_company_label:
     st.subheader("Compute scores from collected data")
     st.caption(f"Raw data collected for **{last_company_label}**. Compute scores using the formula below.")
+    # Fetched once per render; reused by the per-category expanders below
     try:
-        formulas_resp = get_signal_formulas(client=client)
-        formulas = formulas_resp.get("formulas") or {}
+        formulas = get_signal_formulas(client=client).get("formulas") or {}
     except Exception:
         formulas = {}
     for cat in last_categories:
@@ -249,127 +384,9 @@ if last_company_id and last_company_label:
         with st.expander(f"Formula: {label}", expanded=(cat == "technology_hiring")):
             st.markdown(formula_text)
     if st.button("Compute scores", type="primary", key="signals_compute_btn"):
-        try:
-            resp = compute_signals(last_company_id, last_categories, client=client)
-            computed = resp.get("computed") or []
-            msg = resp.get("message", "")
-            if computed:
-                st.success(f"Computed: {', '.join(computed)}. {msg}")
-            else:
-                st.info(msg)
-            st.rerun()
-        except Exception as e:
-            st.error(f"Compute failed: {e}")
-
-# --- Signals table ---
-if last_company_id and last_company_label:
-    st.subheader(f"Signals for {last_company_label}")
-    if st.button("Refresh table", key="signals_refresh_table"):
+        _start_compute(last_company_id, last_company_label, last_categories)
         st.rerun()
-    try:
-        result = get_signals(
-            client=client,
-            page=1,
-            page_size=100,
-            company_id=UUID(last_company_id),
-        )
-    except Exception as e:
-        st.error(f"Cannot load signals: {e}")
-    else:
-        items = result.get("items") or []
-        total = result.get("total", 0)
-        if not items:
-            st.info("No signals yet for this company. Run the pipeline, then click Refresh table.")
-        else:
-            st.caption(f"Total: {total} signals.")
-            st.dataframe(
-                [
-                    {
-                        "id": str(s.get("id", ""))[:8],
-                        "category": s.get("category", ""),
-                        "source": s.get("source", ""),
-                        "raw_value": (s.get("raw_value") or "")[:80],
-                        "score": s.get("normalized_score"),
-                        "confidence": s.get("confidence"),
-                    }
-                    for s in items
-                ],
-                use_container_width=True,
-                hide_index=True,
-            )
 
-            # --- Signal computation by category ---
-            st.subheader("Signal computation by category")
-            st.caption("Expand a category to see how its score was calculated.")
-            CATEGORY_ORDER = [
-                "technology_hiring",
-                "innovation_activity",
-                "digital_presence",
-                "leadership_signals",
-                "glassdoor_reviews",
-                "board_composition",
-            ]
-            CATEGORY_LABELS = {
-                "technology_hiring": "Technology hiring (job)",
-                "innovation_activity": "Innovation activity",
-                "digital_presence": "Digital presence",
-                "leadership_signals": "Leadership signals",
-                "glassdoor_reviews": "Glassdoor reviews",
-                "board_composition": "Board composition",
-            }
-            groups = {}
-            for s in items:
-                cat = s.get("category") or ""
-                groups.setdefault(cat, []).append(s)
-            try:
-                formulas_resp = get_signal_formulas(client=client)
-                formulas = formulas_resp.get("formulas") or {}
-            except Exception:
-                formulas = {}
-            for cat in CATEGORY_ORDER:
-                if cat not in groups or not groups[cat]:
-                    continue
-                label = CATEGORY_LABELS.get(cat, cat.replace("_", " ").title())
-                rep = groups[cat][0]
-                formula_text = formulas.get(cat, "(No formula description.)")
-                with st.expander(label, expanded=False):
-                    st.markdown("**Formula**")
-                    st.markdown(formula_text)
-                    st.markdown("**Computation for this company**")
-                    st.write("Score:", rep.get("normalized_score"), "| Confidence:", rep.get("confidence"))
-                    raw_val = rep.get("raw_value") or ""
-                    if raw_val:
-                        st.write("Raw value:", raw_val[:200] + ("..." if len(raw_val) > 200 else ""))
-                    meta = rep.get("metadata")
-                    if meta and isinstance(meta, dict):
-                        st.markdown("**Metadata**")
-                        st.json(meta)
-                    elif meta:
-                        st.markdown("**Metadata**")
-                        st.write(meta)
-
-# --- Final summary ---
+# --- Signals table and final summary (Refresh table re-runs just this section) ---
 if last_company_id and last_company_label:
-    st.subheader("Final summary")
-    try:
-        summary = get_company_signal_summary(UUID(last_company_id), client=client)
-    except Exception:
-        summary = None
-    if summary:
-        h = float(summary.get("technology_hiring_score") or 0)
-        i = float(summary.get("innovation_activity_score") or 0)
-        d = float(summary.get("digital_presence_score") or 0)
-        l_ = float(summary.get("leadership_signals_score") or 0)
-        composite = (h + i + d + l_) / 4.0 if (h or i or d or l_) else 0.0
-        count = int(summary.get("signal_count") or 0)
-        st.metric("Composite score", f"{composite:.1f}")
-        col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Technology hiring", f"{h:.1f}")
-        col2.metric("Innovation activity", f"{i:.1f}")
-        col3.metric("Digital presence", f"{d:.1f}")
-        col4.metric("Leadership signals", f"{l_:.1f}")
-        st.caption(f"Signal count: {count}")
-    else:
-        st.caption("No summary yet. Run pipeline and Compute to see scores.")
-
-client.close()
+    _signals_results(last_company_id, last_company_label, formulas)
@@ -1,13 +1,13 @@
 """Evidence: company evidence view and backfill trigger."""
 from uuid import UUID
 
+import pandas as pd
 import streamlit as st
 
 from streamlit_ui.components.api_client import (
-    get_client,
     get_company_evidence,
-    get_company_options,
-    get_ticker_to_company_id,
+    get_shared_client,
+    get_ticker_index,
     post_backfill,
 )
 from streamlit_ui.components.json_viewer import render_json
@@ -18,9 +18,9 @@ st.title("Evidence")
 st.caption("Company evidence and backfill")
 
 api_url = get_api_url()
-client = get_client()
-ticker_to_id = get_ticker_to_company_id(client)
-ticker_options, ticker_labels = get_company_options(client)
+client = get_shared_client(api_url)
+# One cached lookup for all three shapes (get_company_options/get_ticker_to_company_id each do one)
+ticker_to_id, ticker_options, ticker_labels = get_ticker_index(api_url.rstrip("/"))
 
 # Evidence view
 st.subheader("Company evidence")
@@ -50,19 +50,11 @@ elif selected_id:
         signals = evidence.get("signals") or []
         st.write(f"Signals: {len(signals)}")
         if signals:
-            st.dataframe(
-                [
-                    {
-                        "category": s.get("category"),
-                        "source": s.get("source"),
-                        "raw_value": (s.get("raw_value") or "")[:50],
-                        "score": s.get("normalized_score"),
-                    }
-                    for s in signals
-                ],
-                use_container_width=True,
-                hide_index=True,
-            )
+            signals_df = pd.DataFrame(
+                signals, columns=["category", "source", "raw_value", "normalized_score"]
+            ).rename(columns={"normalized_score": "score"})
+            signals_df["raw_value"] = signals_df["raw_value"].fillna("").astype(str).str.slice(0, 50)
+            st.dataframe(signals_df, use_container_width=True, hide_index=True)
         render_json(evidence, "View full evidence JSON", expanded=False)
     except Exception as e:
         st.error(f"Failed to load evidence: {e}")
@@ -111,5 +103,3 @@ with st.form("backfill_form"):
             render_json(resp, "Backfill response JSON", expanded=True)
         except Exception as e:
             st.error(f"Backfill request failed: {e}")
-
-client.close()
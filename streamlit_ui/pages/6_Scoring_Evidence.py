@@ -3,8 +3,9 @@ from uuid import UUID
 
 import streamlit as st
 
-from streamlit_ui.components.api_client import get_client, get_company_evidence
+from streamlit_ui.components.api_client import get_company_evidence, get_shared_client
 from streamlit_ui.components.scoring_sidebar import (
+    get_prefetched,
     get_selected_company_id,
     render_scoring_sidebar,
 )
@@ -20,12 +21,13 @@ if not company_id:
     st.info("Select a company in the sidebar.")
     st.stop()
 
-client = get_client()
+client = get_shared_client()
 try:
-    evidence = get_company_evidence(UUID(company_id), client=client)
+    evidence = get_prefetched(
+        "evidence", company_id, lambda: get_company_evidence(UUID(company_id), client=client)
+    )
 except Exception as e:
     st.error(f"Failed to load evidence: {e}")
-    client.close()
     st.stop()
 
 # Group signals by category
@@ -86,5 +88,3 @@ if cat_counts:
         use_container_width=True,
         hide_index=True,
     )
-
-client.close()
@@ -1,12 +1,19 @@
 """Portfolio View: compare up to 5 companies with table and bar charts."""
 import json
+from functools import partial
 from uuid import UUID
 
 import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
-from streamlit_ui.components.api_client import get_client, get_companies, get_industries, get_org_air
+from streamlit_ui.components.api_client import (
+    aget_org_air,
+    get_companies,
+    get_industries,
+    get_shared_client,
+    run_parallel,
+)
 from streamlit_ui.components.scoring_sidebar import render_scoring_sidebar
 
 st.set_page_config(page_title="Portfolio View | PE Org-AI-R", page_icon="📈", layout="wide")
@@ -17,12 +24,11 @@ st.caption("Compare up to 5 companies (NVDA, JPM, WMT, GE, DG or any available)"
 
 # Default suggested tickers; use only those that exist in DB
 SUGGESTED = ["NVDA", "JPM", "WMT", "GE", "DG"]
-client = get_client()
+client = get_shared_client()
 try:
     data = get_companies(client, page=1, page_size=100)
 except Exception:
     st.error("Could not load companies.")
-    client.close()
     st.stop()
 
 items = data.get("items") or []
@@ -48,20 +54,22 @@ if len(selected_tickers) > 5:
 
 if not selected_tickers:
     st.info("Select at least one company.")
-    client.close()
     st.stop()
 
-# Fetch Org-AI-R for each
+# Fetch Org-AI-R for each (concurrently: independent GETs overlap on one async client)
+selected_companies = [(t, ticker_to_company[t]) for t in selected_tickers if t in ticker_to_company]
+try:
+    org_results = run_parallel(
+        *(partial(aget_org_air, co.get("id")) for _, co in selected_companies),
+        return_exceptions=True,
+    )
+except Exception as e:
+    org_results = [e] * len(selected_companies)
 portfolio_results = []
-for ticker in selected_tickers:
-    co = ticker_to_company.get(ticker)
-    if not co:
-        continue
-    cid = co.get("id")
-    try:
-        org = get_org_air(cid, client=client)
+for (ticker, co), org in zip(selected_companies, org_results):
+    if not isinstance(org, Exception):
         portfolio_results.append(org)
-    except Exception:
+    else:
         portfolio_results.append({
             "ticker": ticker,
             "company_name": co.get("name", ticker),
@@ -74,8 +82,6 @@ for ticker in selected_tickers:
             "position_factor": None,
         })
 
-client.close()
-
 if not portfolio_results:
     st.warning("No results for selected companies.")
     st.stop()
@@ -114,7 +114,71 @@ class TestCompanyEndpoints:
         assert data["page"] == 2
         assert data["page_size"] == 10
         assert data["total_pages"] == 5
-    
+
+    def test_list_companies_with_fields(self, client, mock_snowflake):
+        """Test ?fields= returns only the requested item keys."""
+        from datetime import datetime, timezone
+        now = datetime.now(timezone.utc)
+        mock_snowflake.execute_one.return_value = {"count": 1}
+        mock_snowflake.execute_query.return_value = [{
+            "id": str(uuid4()),
+            "name": "Acme Corp",
+            "ticker": "ACME",
+            "industry_id": str(uuid4()),
+            "position_factor": 0.1,
+            "created_at": now,
+            "updated_at": now,
+        }]
+
+        with patch("app.routers.companies.get_snowflake_service", return_value=mock_snowflake):
+            response = client.get("/api/v1/companies?fields=id,ticker,name")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert set(data["items"][0]) == {"id", "ticker", "name"}
+        assert data["items"][0]["ticker"] == "ACME"
+
+    def test_list_companies_expand_industry(self, client, mock_snowflake):
+        """Test ?expand=industry adds industry_name from the joined industries row."""
+        from datetime import datetime, timezone
+        now = datetime.now(timezone.utc)
+        mock_snowflake.execute_one.return_value = {"count": 1}
+        mock_snowflake.execute_query.return_value = [{
+            "id": str(uuid4()),
+            "name": "Acme Corp",
+            "ticker": "ACME",
+            "industry_id": str(uuid4()),
+            "position_factor": 0.1,
+            "created_at": now,
+            "updated_at": now,
+            "industry_name": "Manufacturing",
+        }]
+
+        with patch("app.routers.companies.get_snowflake_service", return_value=mock_snowflake):
+            response = client.get("/api/v1/companies?expand=industry&fields=ticker,industry_name")
+
+        assert response.status_code == 200
+        assert response.json()["items"] == [{"ticker": "ACME", "industry_name": "Manufacturing"}]
+        assert "LEFT JOIN industries" in mock_snowflake.execute_query.call_args[0][0]
+
+    def test_list_companies_unknown_field(self, client, mock_snowflake):
+        """Test ?fields= rejects names that are not company fields."""
+        with patch("app.routers.companies.get_snowflake_service", return_value=mock_snowflake):
+            response = client.get("/api/v1/companies?fields=id,password")
+
+        assert response.status_code == 400
+        assert "password" in response.json()["detail"]
+
+    def test_list_companies_industry_name_requires_expand(self, client, mock_snowflake):
+        """Test ?fields=industry_name without expand=industry is rejected instead of returning empty items."""
+        with patch("app.routers.companies.get_snowflake_service", return_value=mock_snowflake):
+            response = client.get("/api/v1/companies?fields=industry_name")
+
+        assert response.status_code == 400
+        assert "expand=industry" in response.json()["detail"]
+        mock_snowflake.execute_query.assert_not_called()
+
     def test_get_company_not_found(self, client, mock_snowflake, mock_redis):
         """Test getting non-existent company returns 404."""
         mock_redis.get.return_value = None
@@ -255,4 +319,232 @@ class TestDimensionScoreEndpoints:
             )
         
         assert response.status_code == 400
-        assert "already exists" in response.json()["detail"]
\ No newline at end of file
+        assert "already exists" in response.json()["detail"]
+
+
+class TestBatchEndpoint:
+    """Tests for the batch endpoint."""
+
+    def test_batch_runs_calls_in_order(self, client, mock_snowflake, mock_redis):
+        """Test batch returns one result per call, in call order."""
+        industry_id = str(uuid4())
+        mock_snowflake.execute_query.return_value = [
+            {"id": industry_id, "name": "Banking", "sector": "Financial"}
+        ]
+        mock_snowflake.execute_one.return_value = None
+        mock_redis.get.return_value = None
+
+        with patch("app.routers.industries.get_snowflake_service", return_value=mock_snowflake):
+            with patch("app.routers.companies.get_snowflake_service", return_value=mock_snowflake):
+                with patch("app.routers.companies.get_redis_cache", return_value=mock_redis):
+                    response = client.post(
+                        "/api/v1/batch",
+                        json={
+                            "calls": [
+                                {"method": "GET", "path": "/api/v1/industries"},
+                                {"method": "GET", "path": f"/api/v1/companies/{uuid4()}"},
+                            ]
+                        },
+                    )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 2
+        assert results[0]["status"] == 200
+        assert results[0]["json"][0]["id"] == industry_id
+        assert results[1]["status"] == 404
+
+    def test_batch_isolates_unhandled_errors(self, client, mock_snowflake, mock_redis):
+        """Test a call that raises returns a 500 in its own slot and later calls still run."""
+        mock_snowflake.execute_query.side_effect = RuntimeError("db down")
+        mock_snowflake.execute_one.return_value = None
+        mock_redis.get.return_value = None
+
+        with patch("app.routers.industries.get_snowflake_service", return_value=mock_snowflake):
+            with patch("app.routers.companies.get_snowflake_service", return_value=mock_snowflake):
+                with patch("app.routers.companies.get_redis_cache", return_value=mock_redis):
+                    response = client.post(
+                        "/api/v1/batch",
+                        json={
+                            "calls": [
+                                {"method": "GET", "path": "/api/v1/industries"},
+                                {"method": "GET", "path": f"/api/v1/companies/{uuid4()}"},
+                            ]
+                        },
+                    )
+
+        assert response.status_code == 200
+        results = response.json()["results"]
+        assert len(results) == 2
+        assert results[0]["status"] == 500
+        assert results[1]["status"] == 404
+
+    def test_batch_rejects_nested_batch(self, client):
+        """Test batch refuses to call itself or paths outside /api/v1."""
+        response = client.post(
+            "/api/v1/batch",
+            json={"calls": [{"method": "POST", "path": "/api/v1/batch"}]},
+        )
+        assert response.status_code == 400
+
+        response = client.post(
+            "/api/v1/batch",
+            json={"calls": [{"method": "GET", "path": "/health"}]},
+        )
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize(
+        "path",
+        [
+            "/api/v1/../v1/batch",
+            "/api/v1/batch/.",
+            "/api/v1//batch",
+            "/api/v1/%62atch",
+            "/api/v1/%2e%2e/v1/batch",
+        ],
+    )
+    def test_batch_rejects_normalized_batch_paths(self, client, path):
+        """Test dot segments, doubled slashes and percent-encoding cannot smuggle in a nested batch."""
+        response = client.post(
+            "/api/v1/batch",
+            json={"calls": [{"method": "POST", "path": path, "body": {"calls": []}}]},
+        )
+        assert response.status_code == 400
+
+
+class TestConditionalGet:
+    """Tests for ETag / If-None-Match handling on GET endpoints."""
+
+    def test_get_returns_etag_and_304_when_unchanged(self, client, mock_snowflake):
+        """Test a repeated GET with the returned ETag gets 304 and no body."""
+        mock_snowflake.execute_query.return_value = [
+            {"id": str(uuid4()), "name": "Banking", "sector": "Financial"}
+        ]
+
+        with patch("app.routers.industries.get_snowflake_service", return_value=mock_snowflake):
+            first = client.get("/api/v1/industries")
+            etag = first.headers.get("etag")
+            second = client.get("/api/v1/industries", headers={"If-None-Match": etag})
+
+        assert first.status_code == 200
+        assert etag
+        assert first.headers["content-length"] == str(len(first.content))
+        assert second.status_code == 304
+        assert second.content == b""
+
+
+class TestCollectionLogs:
+    """Tests for the collection log cursor (?since=)."""
+
+    def test_document_logs_since_returns_only_new_lines(self, client):
+        """Test since=next_cursor returns only lines appended after the previous call."""
+        from app.routers.documents import _TASK_LOGS
+
+        task_id = str(uuid4())
+        _TASK_LOGS[task_id] = {"lines": ["one", "two"], "finished": False}
+        try:
+            first = client.get(f"/api/v1/documents/collect/logs/{task_id}").json()
+            _TASK_LOGS[task_id]["lines"].append("three")
+            second = client.get(
+                f"/api/v1/documents/collect/logs/{task_id}",
+                params={"since": first["next_cursor"]},
+            ).json()
+        finally:
+            _TASK_LOGS.pop(task_id, None)
+
+        assert first["logs"] == ["one", "two"]
+        assert first["next_cursor"] == 2
+        assert second["logs"] == ["three"]
+        assert second["next_cursor"] == 3
+
+    def test_backend_log_cursor_skips_lines_rolled_out_of_buffer(self, monkeypatch):
+        """Test a since cursor older than the first retained line returns what is still buffered."""
+        import logging
+        from app import log_buffer
+
+        buffer = log_buffer.LogBuffer(max_lines=3)
+        monkeypatch.setattr(log_buffer, "_log_buffer", buffer)
+        handler = log_buffer.InMemoryLogHandler(buffer)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        for i in range(5):
+            handler.emit(logging.LogRecord("test", logging.INFO, __file__, 0, f"line{i}", None, None))
+
+        # line0 and line1 rolled out; cursor 1 predates the first retained line (cursor 2)
+        assert log_buffer.get_log_lines_since(1) == (["line2", "line3", "line4"], 5)
+        assert log_buffer.get_log_lines_since(3) == (["line3", "line4"], 5)
+        assert log_buffer.get_log_lines_since(5) == ([], 5)
+
+
+class TestCompression:
+    """Tests for gzip response compression."""
+
+    def test_large_json_response_is_gzipped(self, client, mock_snowflake):
+        """Test a large JSON response is gzip-encoded when the client accepts gzip."""
+        mock_snowflake.execute_query.return_value = [
+            {"id": str(uuid4()), "name": f"Industry {i}", "sector": "Financial"} for i in range(50)
+        ]
+
+        with patch("app.routers.industries.get_snowflake_service", return_value=mock_snowflake):
+            response = client.get("/api/v1/industries", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers.get("content-encoding") == "gzip"
+        assert response.headers.get("etag")
+        assert len(response.json()) == 50
+
+
+class TestPrefillEndpoint:
+    """Tests for the calculator prefill bundle."""
+
+    def test_prefill_returns_company_and_industry_without_scores(self, client, mock_snowflake):
+        """Test prefill joins the industry and returns org_air null when scoring fails."""
+        company_id = str(uuid4())
+        industry_id = str(uuid4())
+        mock_snowflake.execute_one.return_value = {
+            "id": company_id,
+            "name": "Test Company Inc.",
+            "ticker": "TEST",
+            "industry_id": industry_id,
+            "industry_name": "Banking",
+            "industry_sector": "Financial",
+        }
+
+        with patch("app.routers.scores.get_snowflake_service", return_value=mock_snowflake):
+            with patch(
+                "app.routers.scores.OrgAIRPipeline.run", side_effect=ValueError("no scores")
+            ):
+                response = client.get(f"/api/v1/scores/companies/{company_id}/prefill")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["ticker"] == "TEST"
+        assert data["industry_id"] == industry_id
+        assert data["industry_sector"] == "Financial"
+        assert data["org_air"] is None
+
+    def test_prefill_propagates_non_value_errors(self, client, mock_snowflake):
+        """Test a scoring failure other than ValueError is not reported as org_air null."""
+        mock_snowflake.execute_one.return_value = {
+            "id": str(uuid4()),
+            "name": "Test Company Inc.",
+            "ticker": "TEST",
+            "industry_id": None,
+            "industry_name": None,
+            "industry_sector": None,
+        }
+
+        with patch("app.routers.scores.get_snowflake_service", return_value=mock_snowflake):
+            with patch(
+                "app.routers.scores.OrgAIRPipeline.run", side_effect=RuntimeError("db down")
+            ):
+                with pytest.raises(RuntimeError):
+                    client.get(f"/api/v1/scores/companies/{uuid4()}/prefill")
+
+    def test_prefill_unknown_company_returns_404(self, client, mock_snowflake):
+        """Test prefill returns 404 for a missing company."""
+        mock_snowflake.execute_one.return_value = None
+
+        with patch("app.routers.scores.get_snowflake_service", return_value=mock_snowflake):
+            response = client.get(f"/api/v1/scores/companies/{uuid4()}/prefill")
+
+        assert response.status_code == 404
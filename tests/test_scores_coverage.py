@@ -507,3 +507,78 @@ class TestScoreByTicker:
                 )
 
         assert response.status_code == 500
+
+
+# ---------------------------------------------------------------------------
+# OrgAIRPipeline — company + industry LEFT JOIN
+# ---------------------------------------------------------------------------
+
+def _make_pipeline_db(company_row):
+    """Return a stubbed Snowflake service serving one company row to OrgAIRPipeline.run()."""
+    db = MagicMock()
+    db.execute_one.return_value = company_row
+    db.get_dimension_scores.return_value = {"leadership_vision": 70.0, "ai_governance": 60.0}
+    db.get_evidence_count.return_value = 5
+    db.get_job_raw_payload.return_value = []
+    return db
+
+
+class TestOrgAIRPipelineIndustry:
+    """Tests for the industry columns OrgAIRPipeline.run() reads off the joined company row."""
+
+    def test_run_uses_joined_industry(self):
+        """Test sector and h_r_base come from the joined industry columns."""
+        from app.pipelines.org_air_pipeline import OrgAIRPipeline
+
+        company_id = str(uuid4())
+        db = _make_pipeline_db({
+            "id": company_id,
+            "name": "JPMorgan Chase",
+            "ticker": "JPM",
+            "industry_id": str(uuid4()),
+            "industry_sector": "Financial",
+            "industry_h_r_base": 72,
+        })
+        pipeline = OrgAIRPipeline()
+
+        with patch.object(pipeline._hr_calc, "calculate", wraps=pipeline._hr_calc.calculate) as hr_spy:
+            result = pipeline.run(company_id, db)
+
+        sql, params = db.execute_one.call_args[0]
+        assert "LEFT JOIN industries" in sql
+        assert params == (company_id,)
+        assert result.sector == "financial_services"
+        assert hr_spy.call_args.kwargs["sector"] == "financial_services"
+        assert hr_spy.call_args.kwargs["baseline_override"] == 72.0
+
+    def test_run_falls_back_when_industry_is_null(self):
+        """Test a company without an industry falls back to Services / 65.0."""
+        from app.pipelines.org_air_pipeline import OrgAIRPipeline
+
+        company_id = str(uuid4())
+        db = _make_pipeline_db({
+            "id": company_id,
+            "name": "Orphan Co",
+            "ticker": "ORPH",
+            "industry_id": None,
+            "industry_sector": None,
+            "industry_h_r_base": None,
+        })
+        pipeline = OrgAIRPipeline()
+
+        with patch.object(pipeline._hr_calc, "calculate", wraps=pipeline._hr_calc.calculate) as hr_spy:
+            result = pipeline.run(company_id, db)
+
+        assert result.sector == "business_services"
+        assert result.ticker == "ORPH"
+        assert hr_spy.call_args.kwargs["sector"] == "business_services"
+        assert hr_spy.call_args.kwargs["baseline_override"] == 65.0
+
+    def test_run_company_not_found(self):
+        """Test ValueError when the joined query returns no row."""
+        from app.pipelines.org_air_pipeline import OrgAIRPipeline
+
+        db = _make_pipeline_db(None)
+
+        with pytest.raises(ValueError):
+            OrgAIRPipeline().run(str(uuid4()), db)